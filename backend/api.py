@@ -14,6 +14,7 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 
+import anyio
 import uvicorn
 try:
     from dotenv import load_dotenv
@@ -27,6 +28,7 @@ from fastapi.exceptions import RequestValidationError
 
 # Imports locaux
 from backend.api_errors import AppError
+from backend.api_v1 import cache as api_cache
 import backend.api_v1.core as core
 from backend.api_v1.core import (
     app_error_handler,
@@ -44,7 +46,12 @@ from backend.api_v1.auth import router as auth_router
 from backend.api_v1.bulletins import router as bulletins_router
 from backend.api_v1.pipeline import router as pipeline_router, _auto_pipeline_worker
 from backend.api_v1.metrics import router as metrics_router
-from backend.api_v1.data_management import router as data_management_router
+from backend.api_v1.utils import shutdown_long_job_pools
+from backend.api_v1.data_management import (
+    router as data_management_router,
+    shutdown_upload_pool,
+    warm_upload_extractors,
+)
 from backend.api_v1.validation import router as validation_router
 from backend.api_v1.station_data import router as station_data_router
 
@@ -125,6 +132,7 @@ app.add_exception_handler(Exception, unhandled_error_handler)
 @app.on_event("startup")
 async def startup_event():
     """Initialiser la configuration et la base de données au démarrage."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = core.API_THREADPOOL_SIZE
     core.config = Config()
     core.db_manager = DatabaseManager(core.config.db_path)
     core.db_manager.initialize_database()
@@ -134,10 +142,15 @@ async def startup_event():
         os.getenv("AUTH_PASSWORD"),
         os.getenv("AUTH_ADMIN_EMAILS"),
     )
+    core.reload_auth_users()
     core.result_file = core.config.output_directory / "resultats_interpretes.json"
+    core.READY = True
     
     # Note : Le modèle NLLB sera chargé à la demande (lazy loading) pour économiser la RAM au démarrage
 
+    # Extracteurs PDF/température construits en arrière-plan pour que le premier téléversement n'en paie pas le coût
+    app.state.extractor_warmup = asyncio.get_running_loop().run_in_executor(None, warm_upload_extractors)
+
     if core.AUTO_PIPELINE_ENABLED:
         app.state.auto_pipeline_task = asyncio.create_task(_auto_pipeline_worker())
     
@@ -158,6 +171,7 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Fermer les connexions à l'arrêt."""
+    core.READY = False
     auto_task = getattr(app.state, "auto_pipeline_task", None)
     if auto_task:
         auto_task.cancel()
@@ -166,6 +180,9 @@ async def shutdown_event():
         cleanup_task.cancel()
     if core.db_manager:
         core.db_manager.close()
+    await api_cache.close()
+    shutdown_upload_pool()
+    shutdown_long_job_pools()
     
     # Arrêter proprement le gestionnaire de tâches en arrière-plan
     from backend.utils.background_tasks import shutdown_task_manager
@@ -1,16 +1,23 @@
 import logging
+import re
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+import requests
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from fastapi.concurrency import run_in_threadpool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from backend.api_v1.models import BulletinData, BulletinsPage, TranslationRegenerateRequest
 import backend.api_v1.core as core
 from backend.api_v1.core import _ensure_db_ready, ErrorCode
-from backend.api_v1.utils import _cache_get, _cache_set, _cache_clear, _load_result_file
+from backend.api_v1.data_management import _get_reprocess_extractors
+from backend.api_v1.utils import _cache_get, _cache_set, _cache_clear, _cache_delete, _load_result_file, _run_long_job
 from backend.utils.background_tasks import get_task_manager, TaskStatus
 from backend.modules.data_integrator import DataIntegrator
 from backend.modules.icon_classifier import IconClassifier
@@ -21,12 +28,110 @@ from backend.modules.workflow_temperature_extractor import WorkflowTemperatureEx
 logger = logging.getLogger("anam.api")
 router = APIRouter(tags=["bulletins"])
 
+MOORE_TRANSLATE_URL = "https://fr-mos-translator-314397473739.europe-west1.run.app/api/translate"
+# (connexion, lecture) : echouer vite si le service est injoignable.
+MOORE_TRANSLATE_TIMEOUT = (5, 30)
+
+MOORE_TRANSLATE_RETRIES = 2
+
+
+def _build_moore_session() -> requests.Session:
+    """Session partagee : keep-alive + retries (backoff exponentiel avec jitter) sur timeouts et 5xx."""
+    retry_kwargs = {
+        "total": MOORE_TRANSLATE_RETRIES,
+        "connect": MOORE_TRANSLATE_RETRIES,
+        "read": MOORE_TRANSLATE_RETRIES,
+        "status": MOORE_TRANSLATE_RETRIES,
+        "backoff_factor": 0.5,
+        "status_forcelist": (500, 502, 503, 504),
+        "raise_on_status": False,
+    }
+    # La traduction est idempotente : on autorise le rejeu du POST.
+    try:
+        retry = Retry(allowed_methods=frozenset({"POST"}), backoff_jitter=0.5, **retry_kwargs)
+    except TypeError:
+        retry = Retry(method_whitelist=frozenset({"POST"}), **retry_kwargs)
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry),
+    )
+    return session
+
+
+_MOORE_SESSION = _build_moore_session()
+# Le service Cloud Run a une capacite limitee : un seul plafond pour toutes les traductions mooré.
+_MOORE_SEMAPHORE = threading.BoundedSemaphore(core.MOORE_MAX_CONCURRENCY)
+
+
+def _translate_moore_external(text: str, session: Optional[requests.Session] = None) -> str:
+    payload = {
+        "text": text,
+        "source_lang": "french",
+        "target_lang": "moore"
+    }
+    try:
+        with _MOORE_SEMAPHORE:
+            response = (session or _MOORE_SESSION).post(
+                MOORE_TRANSLATE_URL,
+                json=payload,
+                timeout=MOORE_TRANSLATE_TIMEOUT,
+            )
+        if response.status_code == 200:
+            result = response.json()
+            return result.get("translation", "")
+        logger.warning(f"API externe a retourné le statut {response.status_code}")
+        return ""
+    except Exception as e:
+        logger.error(f"Erreur lors de la traduction via API externe : {e}")
+        return ""
+
+
+async def _translate_moore_external_async(text: str) -> str:
+    """Meme client et meme plafond que les taches de fond, sur un executeur dedie (hors jetons anyio)."""
+    return await _run_long_job("moore", _translate_moore_external, text, max_workers=core.MOORE_MAX_CONCURRENCY)
+
+
+REPROCESS_PROGRESS_INTERVAL_SECONDS = 1.0
+
+_TYPE_MAP = {
+    "prevision": "forecast",
+    "prévision": "forecast",
+    "forecast": "forecast",
+    "observation": "observation",
+    "obs": "observation",
+}
+_FORECAST_TOKENS = ("forecast", "prevision")
+_FORECAST_NAME_RE = re.compile(r"forecast|pr[e\u00e9]vision", re.IGNORECASE)
+_OBSERVATION_NAME_RE = re.compile(r"obs", re.IGNORECASE)
+
+_GENERIC_STATION_NAMES = frozenset({"bulletin national", "national", "all", "tout", "toutes"})
+_ALL_LANGS = frozenset({None, "all"})
+_FR_LANGS = frozenset({None, "all", "interpretation_francais", "fr", "francais"})
+_MOORE_LANGS = frozenset({"moore", "interpretation_moore"})
+_DIOULA_LANGS = frozenset({"dioula", "interpretation_dioula"})
+
+
+def _is_forecast_payload(entry: dict) -> bool:
+    if entry.get("type") == "forecast":
+        return True
+    pdf_lower = str(entry.get("pdf_path") or "").casefold()
+    return any(token in pdf_lower for token in _FORECAST_TOKENS)
+
+
+def _detect_bulletin_type(station: dict, pdf_path: Optional[str]) -> tuple[str, str]:
+    """Retourne (type brut, type DB) pour une station traduite."""
+    raw_type = station.get("type")
+    if not raw_type:
+        pdf_lower = str(pdf_path).casefold()
+        raw_type = "forecast" if any(token in pdf_lower for token in _FORECAST_TOKENS) else "observation"
+    return raw_type, _TYPE_MAP.get(str(raw_type).casefold(), "observation")
+
 
 def _infer_bulletin_type_from_filename(filename: str) -> Optional[str]:
-    lowered = filename.lower()
-    if "forecast" in lowered or "prevision" in lowered or "prÃ©vision" in lowered:
+    if _FORECAST_NAME_RE.search(filename):
         return "forecast"
-    if "observed" in lowered or "observation" in lowered or "obs" in lowered:
+    if _OBSERVATION_NAME_RE.search(filename):
         return "observation"
     return None
 
@@ -50,8 +155,9 @@ def _resolve_pdf_path(file_path: str, pdf_directory: Path, project_root: Path) -
         direct = pdf_directory / name
         if direct.exists():
             return direct
+        name_lower = name.lower()
         for pdf in pdf_directory.glob("*.pdf"):
-            if pdf.name.lower() == name.lower():
+            if pdf.name.lower() == name_lower:
                 return pdf
     return None
 
@@ -91,16 +197,12 @@ def _try_redownload_pdf(
         output_dir=str(target_path.parent),
         config=ScrapeConfig(),
     )
-    bulletins = scraper.get_bulletin_list(
-        use_pagination=True,
-        max_pages=2,
+    bulletins = scraper.iter_bulletins(
         year=parsed_date.year,
         month=parsed_date.month,
         day=parsed_date.day,
+        max_pages=2,
     )
-    if not bulletins:
-        return None
-
     for bulletin in bulletins:
         pdf_url = scraper.extract_pdf_link(bulletin.get("url"))
         if not pdf_url:
@@ -121,6 +223,102 @@ def _fill_missing_values(target: dict, source: dict, keys: list[str]) -> None:
             target[key] = source[key]
 
 
+def _resolve_french_text(
+    interpreter,
+    target_station: dict,
+    station_payloads: list[dict],
+    regenerate: bool,
+    bulletin_date: str,
+) -> Optional[str]:
+    """Texte FR de la station : regenere si demande, sinon existant ; la generation n'est tentee qu'une fois."""
+    if regenerate:
+        generated = interpreter._generate_french_bulletin(target_station)
+        if generated:
+            target_station["interpretation_francais"] = generated
+
+    french_text = target_station.get("interpretation_francais")
+    if not french_text:
+        for entry in station_payloads:
+            if entry.get("interpretation_francais"):
+                french_text = entry.get("interpretation_francais")
+                target_station["interpretation_francais"] = french_text
+                break
+
+    if not french_text and not regenerate:
+        logger.info(f"Extraction automatique du texte FR pour le bulletin du {bulletin_date}")
+        french_text = interpreter._generate_french_bulletin(target_station)
+        if french_text:
+            target_station["interpretation_francais"] = french_text
+    return french_text
+
+
+def _clear_station_interpretations(station: dict) -> dict:
+    """Vide les interpretations de la station (sans copie) et la retourne."""
+    station["interpretation_francais"] = None
+    station["interpretation_moore"] = None
+    station["interpretation_dioula"] = None
+    return station
+
+
+def _locate_target_station(
+    station_payloads: list[dict],
+    station_name: str,
+    is_generic: bool,
+) -> tuple[Optional[dict], Optional[dict]]:
+    """Premier (payload, station) correspondant ; premiere station disponible si la demande est generique."""
+    for entry in station_payloads:
+        stations = entry.get("stations") or []
+        if is_generic:
+            if stations:
+                return entry, stations[0]
+            continue
+        for station in stations:
+            if station.get("name") == station_name:
+                return entry, station
+    return None, None
+
+
+def _apply_translations_to_payload(
+    entry: dict,
+    station_name: Optional[str],
+    translations: dict,
+    station_snapshot: dict,
+) -> dict:
+    """Reporte les traductions et le snapshot dans le payload du PDF cible."""
+    for lang_key in ["fr", "moore", "dioula"]:
+        if lang_key in translations:
+            field_name = "interpretation_francais" if lang_key == "fr" else f"interpretation_{lang_key}"
+            entry[field_name] = translations[lang_key]
+
+    for i, st in enumerate(entry.get("stations", [])):
+        if st.get("name") == station_name:
+            entry["stations"][i] = station_snapshot
+            break
+    return entry
+
+
+def _invalidate_bulletin_date_cache(bulletin_date: str) -> None:
+    """Invalide le detail de cette date et celui de J+1, qui reprend les previsions (et traductions) de J."""
+    try:
+        next_date = (datetime.strptime(bulletin_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+    except ValueError:
+        _cache_clear("bulletins:")
+        return
+    _cache_delete(
+        *(
+            f"bulletins:detail:{day}:{suffix}"
+            for day in (bulletin_date, next_date)
+            for suffix in ("all", "observation", "forecast")
+        )
+    )
+
+
+def _index_stations_by_name(stations: Optional[list]) -> dict[str, dict]:
+    if not stations:
+        return {}
+    return {station["name"]: station for station in stations if station.get("name")}
+
+
 def _reprocess_pdf_entry(
     file_path: str,
     pdf_path: Path,
@@ -141,11 +339,6 @@ def _reprocess_pdf_entry(
     icon_data = icon_classifier.classify_icons([pdf_result])
 
     existing_payload = db_manager.get_bulletin_payload_by_path(file_path) or {}
-    existing_station_map = {
-        station.get("name"): station
-        for station in (existing_payload.get("stations") or [])
-        if station.get("name")
-    }
 
     bulletins = db_manager.list_bulletins_by_file_path(file_path)
     bulletins_by_type = {entry.get("type"): entry for entry in bulletins if entry.get("type")}
@@ -256,6 +449,8 @@ def _reprocess_pdf_entry(
     if not station_records:
         return "Aucune station extraite."
 
+    # Index construit uniquement lorsqu'il y a des stations a fusionner.
+    existing_station_map = _index_stations_by_name(existing_payload.get("stations"))
     stations_payload = []
     seen_names = set()
     for record in station_records.values():
@@ -307,15 +502,13 @@ def _reprocess_pdf_entry(
                 continue
             stations_payload.append(station)
 
-    payload = dict(existing_payload) if isinstance(existing_payload, dict) else {}
-    payload.update(
-        {
-            "pdf_path": file_path,
-            "date": date_for_payload,
-            "type": payload_type,
-            "stations": stations_payload,
-        }
-    )
+    payload = {
+        **(existing_payload if isinstance(existing_payload, dict) else {}),
+        "pdf_path": file_path,
+        "date": date_for_payload,
+        "type": payload_type,
+        "stations": stations_payload,
+    }
     db_manager.upsert_bulletin_payload(file_path, payload)
     return None
 
@@ -380,7 +573,7 @@ async def get_bulletin_by_date(
             dt_obj = datetime.strptime(date, "%Y-%m-%d")
             prev_date = (dt_obj - timedelta(days=1)).strftime("%Y-%m-%d")
             prev_payloads = core.db_manager.list_bulletin_payloads_by_date(prev_date)
-            prev_forecasts = [p for p in prev_payloads if p.get("type") == "forecast" or "forecast" in str(p.get("pdf_path")).lower() or "prevision" in str(p.get("pdf_path")).lower()]
+            prev_forecasts = [p for p in prev_payloads if _is_forecast_payload(p)]
             payloads = prev_forecasts + payloads
         except Exception as e:
             logger.warning(f"Erreur lors de la récupération du bulletin J-1 pour {date}: {e}")
@@ -450,160 +643,83 @@ async def regenerate_translation(payload: TranslationRegenerateRequest):
     if not station_payloads:
         raise HTTPException(status_code=404, detail="Bulletin non trouvé pour cette date.")
         
-    target_station = None
-    target_pdf_path = None
-    is_generic = payload.station_name.lower() in ["bulletin national", "national", "all", "tout", "toutes"]
+    is_generic = payload.station_name.lower() in _GENERIC_STATION_NAMES
     
     # ✨ PRIORITÉ AUX PRÉVISIONS : Chercher d'abord les bulletins de type "forecast"
-    forecast_payloads = [p for p in station_payloads if p.get("type") == "forecast" or "forecast" in str(p.get("pdf_path", "")).lower() or "prevision" in str(p.get("pdf_path", "")).lower()]
-    observation_payloads = [p for p in station_payloads if p not in forecast_payloads]
+    forecast_payloads = []
+    observation_payloads = []
+    for p in station_payloads:
+        if _is_forecast_payload(p):
+            forecast_payloads.append(p)
+        else:
+            observation_payloads.append(p)
     
     # Parcourir d'abord les prévisions, puis les observations
     payloads_to_check = forecast_payloads + observation_payloads
     
-    for entry in payloads_to_check:
-        if is_generic and entry.get("stations"):
-            target_station = entry["stations"][0]
-            target_pdf_path = entry.get("pdf_path")
-            break
-        for station in entry.get("stations", []):
-            if station.get("name") == payload.station_name:
-                target_station = station
-                target_pdf_path = entry.get("pdf_path")
-                break
-        if target_station:
-            target_station["pdf_path"] = target_pdf_path
-            target_station["date"] = payload.date
-            break
-            
+    target_entry, target_station = _locate_target_station(payloads_to_check, payload.station_name, is_generic)
     if not target_station:
-        if is_generic and payloads_to_check:
-             for entry in payloads_to_check:
-                 if entry.get("stations"):
-                     target_station = entry["stations"][0].copy()
-                     target_pdf_path = entry.get("pdf_path")
-                     target_station["pdf_path"] = target_pdf_path
-                     target_station["date"] = payload.date
-                     break
-        
-        if not target_station:
-            raise HTTPException(status_code=404, detail="Station ou bulletin non trouvé pour cette date.")
+        raise HTTPException(status_code=404, detail="Station ou bulletin non trouvé pour cette date.")
+    target_pdf_path = target_entry.get("pdf_path")
+    target_station["pdf_path"] = target_pdf_path
+    target_station["date"] = payload.date
         
     from backend.modules.language_interpreter import LanguageInterpreter
     interpreter = LanguageInterpreter.get_shared(core.db_manager)
     
-    # ✨ Intégration de la nouvelle API de traduction en mooré
-    async def translate_with_external_api(text: str, target_lang: str) -> str:
-        """Utilise l'API externe pour la traduction en mooré"""
-        if target_lang != "moore":
-            # Pour les autres langues, utiliser l'interpréteur existant
-            return interpreter.translate(text, target_lang, force=True)
-        
-        import aiohttp
-        import asyncio
-        
-        url = "https://fr-mos-translator-314397473739.europe-west1.run.app/api/translate"
-        payload = {
-            "text": text,
-            "source_lang": "french",
-            "target_lang": "moore"
-        }
-        
-        try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("translation", "")
-                    else:
-                        logger.warning(f"API externe a retourné le statut {response.status}")
-                        return ""
-        except Exception as e:
-            logger.error(f"Erreur lors de la traduction via API externe : {e}")
-            return ""
-    
-    if payload.language in [None, "all", "interpretation_francais", "fr", "francais"]:
-        french_text = interpreter._generate_french_bulletin(target_station)
-        if french_text:
-            target_station["interpretation_francais"] = french_text
-            
-    french_text = target_station.get("interpretation_francais")
-    if not french_text:
-        for entry in station_payloads:
-            if entry.get("interpretation_francais"):
-                french_text = entry.get("interpretation_francais")
-                target_station["interpretation_francais"] = french_text
-                break
-    
-    if not french_text:
-        logger.info(f"Extraction automatique du texte FR pour le bulletin du {payload.date}")
-        french_text = interpreter._generate_french_bulletin(target_station)
-        if french_text:
-            target_station["interpretation_francais"] = french_text
+    french_text = _resolve_french_text(
+        interpreter,
+        target_station,
+        station_payloads,
+        regenerate=payload.language in _FR_LANGS,
+        bulletin_date=payload.date,
+    )
 
     if not french_text:
         raise HTTPException(status_code=400, detail="Impossible d'extraire le texte français du PDF. Vérifiez que le fichier existe.")
         
     langs_to_regen = []
-    if payload.language in [None, "all"]:
+    if payload.language in _ALL_LANGS:
         langs_to_regen = ["moore", "dioula"]
-    elif payload.language in ["moore", "interpretation_moore"]:
+    elif payload.language in _MOORE_LANGS:
         langs_to_regen = ["moore"]
-    elif payload.language in ["dioula", "interpretation_dioula"]:
+    elif payload.language in _DIOULA_LANGS:
         langs_to_regen = ["dioula"]
         
     new_translations = {"fr": french_text}
     for lang in langs_to_regen:
         if lang == "moore":
-            # Utiliser l'API externe pour le mooré
-            translated = await translate_with_external_api(french_text, lang)
+            # Utiliser l'API externe pour le mooré (client asynchrone partagé)
+            translated = await _translate_moore_external_async(french_text)
         else:
-            # Utiliser l'interpréteur existant pour le dioula
-            translated = interpreter.translate(french_text, lang, force=True)
+            # Utiliser l'interpréteur existant pour le dioula (bloquant : executeur dedie, hors boucle d'événements)
+            translated = await _run_long_job("translation", interpreter.translate, french_text, lang, force=True, max_workers=2)
             
         if translated:
             target_station[f"interpretation_{lang}"] = translated
             new_translations[lang] = translated
             
-    raw_type = target_station.get("type") or ("forecast" if "forecast" in str(target_pdf_path).lower() or "prevision" in str(target_pdf_path).lower() else "observation")
-    type_map = {
-        "prevision": "forecast",
-        "prévision": "forecast",
-        "forecast": "forecast",
-        "observation": "observation",
-        "obs": "observation"
-    }
-    bulletin_type_detected = type_map.get(str(raw_type).lower(), "observation")
+    raw_type, bulletin_type_detected = _detect_bulletin_type(target_station, target_pdf_path)
     
     logger.info(f"Mise à jour DB pour le bulletin {payload.date} (Type détecté: {raw_type} -> DB: {bulletin_type_detected})")
-    rows_updated = core.db_manager.update_bulletin_interpretations(payload.date, bulletin_type_detected, new_translations)
-    logger.info(f"Nombre de lignes mises à jour dans 'bulletins' : {rows_updated}")
+    # Les traductions sont portees par le bulletin : la station est remise a zero sur place.
+    station_snapshot = _clear_station_interpretations(target_station)
     
-    station_snapshot = target_station.copy()
-    station_snapshot["interpretation_francais"] = None
-    station_snapshot["interpretation_moore"] = None
-    station_snapshot["interpretation_dioula"] = None
-    
-    core.db_manager.upsert_station_snapshot(target_pdf_path, station_snapshot)
-    
-    for entry in station_payloads:
-        if entry.get("pdf_path") == target_pdf_path:
-            for lang_key in ["fr", "moore", "dioula"]:
-                if lang_key in new_translations:
-                    field_name = "interpretation_francais" if lang_key == "fr" else f"interpretation_{lang_key}"
-                    entry[field_name] = new_translations[lang_key]
-            
-            for i, st in enumerate(entry.get("stations", [])):
-                if st.get("name") == target_station.get("name"):
-                    entry["stations"][i] = station_snapshot
-                    break
-            
-            core.db_manager.upsert_bulletin_payload(target_pdf_path, entry)
-            logger.info(f"Payload JSON mis à jour pour {target_pdf_path}")
-            break
+    payload_entry = _apply_translations_to_payload(
+        target_entry, target_station.get("name"), new_translations, station_snapshot
+    )
+    rows_updated = core.db_manager.apply_translation_result(
+        payload.date,
+        bulletin_type_detected,
+        new_translations,
+        target_pdf_path,
+        station_snapshot=station_snapshot,
+        payload_entry=payload_entry,
+    )
+    logger.info(f"Nombre de lignes mises à jour dans 'bulletins' : {rows_updated}")
+    logger.info(f"Payload JSON mis à jour pour {target_pdf_path}")
             
-    _cache_clear("bulletins:")
+    _invalidate_bulletin_date_cache(payload.date)
     
     return {
         "status": "success",
@@ -653,11 +769,11 @@ async def regenerate_translation_async(payload: TranslationRegenerateRequest):
     if target_bulletin:
         # Déterminer les langues à vérifier
         langs_to_check = []
-        if payload.language in [None, "all"]:
+        if payload.language in _ALL_LANGS:
             langs_to_check = ["moore", "dioula"]
-        elif payload.language in ["moore", "interpretation_moore"]:
+        elif payload.language in _MOORE_LANGS:
             langs_to_check = ["moore"]
-        elif payload.language in ["dioula", "interpretation_dioula"]:
+        elif payload.language in _DIOULA_LANGS:
             langs_to_check = ["dioula"]
         
         # Vérifier si toutes les traductions demandées existent déjà
@@ -701,97 +817,37 @@ async def regenerate_translation_async(payload: TranslationRegenerateRequest):
         
         # Récupérer les données de la station
         station_payloads = core.db_manager.list_bulletin_payloads_by_date(payload.date)
-        target_station = None
-        target_pdf_path = None
-        is_generic = payload.station_name.lower() in ["bulletin national", "national", "all", "tout", "toutes"]
-        
-        for entry in station_payloads:
-            if is_generic and entry.get("stations"):
-                target_station = entry["stations"][0].copy()
-                target_pdf_path = entry.get("pdf_path")
-                break
-            for station in entry.get("stations", []):
-                if station.get("name") == payload.station_name:
-                    target_station = station.copy()
-                    target_pdf_path = entry.get("pdf_path")
-                    break
-            if target_station:
-                target_station["pdf_path"] = target_pdf_path
-                target_station["date"] = payload.date
-                break
+        is_generic = payload.station_name.lower() in _GENERIC_STATION_NAMES
         
+        target_entry, target_station = _locate_target_station(station_payloads, payload.station_name, is_generic)
         if not target_station:
-            if is_generic and station_payloads:
-                for entry in station_payloads:
-                    if entry.get("stations"):
-                        target_station = entry["stations"][0].copy()
-                        target_pdf_path = entry.get("pdf_path")
-                        target_station["pdf_path"] = target_pdf_path
-                        target_station["date"] = payload.date
-                        break
-            
-            if not target_station:
-                raise ValueError("Station ou bulletin non trouvé pour cette date.")
+            raise ValueError("Station ou bulletin non trouvé pour cette date.")
+        target_pdf_path = target_entry.get("pdf_path")
+        target_station["pdf_path"] = target_pdf_path
+        target_station["date"] = payload.date
         
         # Interpréteur partagé
         interpreter = LanguageInterpreter.get_shared(core.db_manager)
         
-        # ✨ Intégration de la nouvelle API de traduction en mooré
-        def translate_with_external_api_sync(text: str, target_lang: str) -> str:
-            """Version synchrone de la traduction via API externe"""
-            if target_lang != "moore":
-                return interpreter.translate(text, target_lang, force=True)
-            
-            import requests
-            
-            url = "https://fr-mos-translator-314397473739.europe-west1.run.app/api/translate"
-            payload = {
-                "text": text,
-                "source_lang": "french",
-                "target_lang": "moore"
-            }
-            
-            try:
-                response = requests.post(url, json=payload, timeout=30)
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("translation", "")
-                else:
-                    logger.warning(f"API externe a retourné le statut {response.status_code}")
-                    return ""
-            except Exception as e:
-                logger.error(f"Erreur lors de la traduction via API externe : {e}")
-                return ""
-        
         # Générer le texte français si nécessaire
-        if payload.language in [None, "all", "interpretation_francais", "fr", "francais"]:
-            french_text = interpreter._generate_french_bulletin(target_station)
-            if french_text:
-                target_station["interpretation_francais"] = french_text
-        
-        french_text = target_station.get("interpretation_francais")
-        if not french_text:
-            for entry in station_payloads:
-                if entry.get("interpretation_francais"):
-                    french_text = entry.get("interpretation_francais")
-                    target_station["interpretation_francais"] = french_text
-                    break
-        
-        if not french_text:
-            french_text = interpreter._generate_french_bulletin(target_station)
-            if french_text:
-                target_station["interpretation_francais"] = french_text
+        french_text = _resolve_french_text(
+            interpreter,
+            target_station,
+            station_payloads,
+            regenerate=payload.language in _FR_LANGS,
+            bulletin_date=payload.date,
+        )
         
         if not french_text:
             raise ValueError("Impossible d'extraire le texte français du PDF.")
         
         # Déterminer les langues à régénérer
         langs_to_regen = []
-        if payload.language in [None, "all"]:
+        if payload.language in _ALL_LANGS:
             langs_to_regen = ["moore", "dioula"]
-        elif payload.language in ["moore", "interpretation_moore"]:
+        elif payload.language in _MOORE_LANGS:
             langs_to_regen = ["moore"]
-        elif payload.language in ["dioula", "interpretation_dioula"]:
+        elif payload.language in _DIOULA_LANGS:
             langs_to_regen = ["dioula"]
         
         # Générer les traductions
@@ -799,7 +855,7 @@ async def regenerate_translation_async(payload: TranslationRegenerateRequest):
         for lang in langs_to_regen:
             if lang == "moore":
                 # Utiliser l'API externe pour le mooré
-                translated = translate_with_external_api_sync(french_text, lang)
+                translated = _translate_moore_external(french_text)
             else:
                 # Utiliser l'interpréteur existant pour le dioula
                 translated = interpreter.translate(french_text, lang, force=True)
@@ -809,51 +865,25 @@ async def regenerate_translation_async(payload: TranslationRegenerateRequest):
                 new_translations[lang] = translated
         
         # Détecter le type de bulletin
-        raw_type = target_station.get("type") or (
-            "forecast" if "forecast" in str(target_pdf_path).lower() or "prevision" in str(target_pdf_path).lower() else "observation"
-        )
-        type_map = {
-            "prevision": "forecast",
-            "prévision": "forecast",
-            "forecast": "forecast",
-            "observation": "observation",
-            "obs": "observation"
-        }
-        bulletin_type_detected = type_map.get(str(raw_type).lower(), "observation")
+        _raw_type, bulletin_type_detected = _detect_bulletin_type(target_station, target_pdf_path)
         
-        # Mise à jour de la base de données
-        rows_updated = core.db_manager.update_bulletin_interpretations(
+        # Snapshot + payload, ecrits avec les traductions dans une seule transaction
+        station_snapshot = _clear_station_interpretations(target_station)
+        payload_entry = _apply_translations_to_payload(
+            target_entry, target_station.get("name"), new_translations, station_snapshot
+        )
+        rows_updated = core.db_manager.apply_translation_result(
             payload.date,
             bulletin_type_detected,
-            new_translations
+            new_translations,
+            target_pdf_path,
+            station_snapshot=station_snapshot,
+            payload_entry=payload_entry,
         )
         logger.info(f"✅ Tâche {task_id}: {rows_updated} ligne(s) mise(s) à jour dans la BD")
         
-        # Mise à jour du snapshot
-        station_snapshot = target_station.copy()
-        station_snapshot["interpretation_francais"] = None
-        station_snapshot["interpretation_moore"] = None
-        station_snapshot["interpretation_dioula"] = None
-        core.db_manager.upsert_station_snapshot(target_pdf_path, station_snapshot)
-        
-        # Mise à jour du payload
-        for entry in station_payloads:
-            if entry.get("pdf_path") == target_pdf_path:
-                for lang_key in ["fr", "moore", "dioula"]:
-                    if lang_key in new_translations:
-                        field_name = "interpretation_francais" if lang_key == "fr" else f"interpretation_{lang_key}"
-                        entry[field_name] = new_translations[lang_key]
-                
-                for i, st in enumerate(entry.get("stations", [])):
-                    if st.get("name") == target_station.get("name"):
-                        entry["stations"][i] = station_snapshot
-                        break
-                
-                core.db_manager.upsert_bulletin_payload(target_pdf_path, entry)
-                break
-        
         # Nettoyer le cache
-        _cache_clear("bulletins:")
+        _invalidate_bulletin_date_cache(payload.date)
         
         return {
             "status": "success",
@@ -897,9 +927,9 @@ async def get_translation_task_status(task_id: str):
         "task_id": task.task_id,
         "status": task.status.value,
         "task_type": task.task_type,
-        "created_at": task.created_at.isoformat() if task.created_at else None,
-        "started_at": task.started_at.isoformat() if task.started_at else None,
-        "finished_at": task.finished_at.isoformat() if task.finished_at else None,
+        "created_at": task.isoformat("created_at"),
+        "started_at": task.isoformat("started_at"),
+        "finished_at": task.isoformat("finished_at"),
         "progress": task.progress,
         "metadata": task.metadata,
     }
@@ -915,10 +945,12 @@ async def get_translation_task_status(task_id: str):
 
 @router.get("/bulletins/translation-tasks")
 async def list_translation_tasks(
-    status: Optional[str] = Query(None, enum=["pending", "running", "completed", "failed", "cancelled"])
+    status: Optional[str] = Query(None, enum=["pending", "running", "completed", "failed", "cancelled"]),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
 ):
     """
-    Liste toutes les tâches de traduction.
+    Liste les tâches de traduction (paginées).
     
     Optionnellement, filtre par statut.
     """
@@ -926,13 +958,7 @@ async def list_translation_tasks(
     all_tasks = task_manager.get_all_tasks()
     
     # Filtrer par statut si spécifié
-    if status:
-        filtered = {
-            tid: task for tid, task in all_tasks.items()
-            if task.status.value == status
-        }
-    else:
-        filtered = all_tasks
+    matches = [task for task in all_tasks.values() if not status or task.status.value == status]
     
     return {
         "tasks": [
@@ -940,14 +966,16 @@ async def list_translation_tasks(
                 "task_id": task.task_id,
                 "status": task.status.value,
                 "task_type": task.task_type,
-                "created_at": task.created_at.isoformat() if task.created_at else None,
-                "started_at": task.started_at.isoformat() if task.started_at else None,
-                "finished_at": task.finished_at.isoformat() if task.finished_at else None,
+                "created_at": task.isoformat("created_at"),
+                "started_at": task.isoformat("started_at"),
+                "finished_at": task.isoformat("finished_at"),
                 "metadata": task.metadata,
             }
-            for task in filtered.values()
+            for task in matches[offset:offset + limit]
         ],
-        "total": len(filtered),
+        "total": len(matches),
+        "limit": limit,
+        "offset": offset,
         "running_count": task_manager.get_running_tasks_count(),
     }
 
@@ -1017,60 +1045,76 @@ async def start_bulletins_reprocess(background_tasks: BackgroundTasks):
 
     def _job_runner():
         errors = []
+        worker_state = threading.local()
+
+        def _worker_tools():
+            # Extracteurs partages (figes apres l'init) ; seul l'integrateur, avec son cache de stations, reste par thread.
+            data_integrator = getattr(worker_state, "data_integrator", None)
+            if data_integrator is None:
+                data_integrator = DataIntegrator(core.db_manager)
+                worker_state.data_integrator = data_integrator
+            return (*_get_reprocess_extractors(), data_integrator)
+
+        def _process_file(file_path: str) -> tuple[str, Optional[str]]:
+            pdf_extractor, temp_extractor, icon_classifier, data_integrator = _worker_tools()
+            resolved_path = _resolve_pdf_path(
+                file_path,
+                core.config.pdf_directory,
+                core.config.project_root,
+            )
+            if resolved_path is None:
+                bulletin_records = core.db_manager.list_bulletins_by_file_path(file_path)
+                fallback_date = (
+                    bulletin_records[0].get("date") if bulletin_records else None
+                ) or data_integrator._extract_bulletin_date(Path(file_path))
+                resolved_path = _try_redownload_pdf(
+                    file_path,
+                    fallback_date,
+                    core.config.pdf_directory,
+                    core.config.project_root,
+                )
+
+            if resolved_path is None:
+                return "missing", "PDF introuvable, impossible de retélécharger."
+            error_message = _reprocess_pdf_entry(
+                file_path=file_path,
+                pdf_path=resolved_path,
+                db_manager=core.db_manager,
+                data_integrator=data_integrator,
+                pdf_extractor=pdf_extractor,
+                temp_extractor=temp_extractor,
+                icon_classifier=icon_classifier,
+            )
+            if error_message:
+                return "failed", error_message
+            return "success", None
+
         try:
             core.db_manager.update_job(batch_id, status="running", result={"progress": progress, "errors": errors})
 
-            pdf_extractor = PDFExtractor(
-                core.config.pdf_directory,
-                core.config.output_directory,
-            )
-            temp_extractor = WorkflowTemperatureExtractor(roi_config_path=core.config.roi_config_path)
-            icon_classifier = IconClassifier(roi_config_path=core.config.roi_config_path)
-            data_integrator = DataIntegrator(core.db_manager)
-
-            for index, file_path in enumerate(file_paths, start=1):
-                try:
-                    resolved_path = _resolve_pdf_path(
-                        file_path,
-                        core.config.pdf_directory,
-                        core.config.project_root,
-                    )
-                    if resolved_path is None:
-                        bulletin_records = core.db_manager.list_bulletins_by_file_path(file_path)
-                        fallback_date = (
-                            bulletin_records[0].get("date") if bulletin_records else None
-                        ) or data_integrator._extract_bulletin_date(Path(file_path))
-                        resolved_path = _try_redownload_pdf(
-                            file_path,
-                            fallback_date,
-                            core.config.pdf_directory,
-                            core.config.project_root,
-                        )
-
-                    if resolved_path is None:
-                        progress["missing"] += 1
-                        errors.append(f"{Path(file_path).name}: PDF introuvable, impossible de retélécharger.")
-                    else:
-                        error_message = _reprocess_pdf_entry(
-                            file_path=file_path,
-                            pdf_path=resolved_path,
-                            db_manager=core.db_manager,
-                            data_integrator=data_integrator,
-                            pdf_extractor=pdf_extractor,
-                            temp_extractor=temp_extractor,
-                            icon_classifier=icon_classifier,
-                        )
-                        if error_message:
-                            progress["failed"] += 1
-                            errors.append(f"{Path(file_path).name}: {error_message}")
-                        else:
-                            progress["success"] += 1
-                except Exception as exc:
-                    progress["failed"] += 1
-                    errors.append(f"{Path(file_path).name}: {exc}")
-                finally:
-                    progress["current"] = index
-                    core.db_manager.update_job(batch_id, result={"progress": progress, "errors": errors})
+            last_persist = time.monotonic()
+            with ThreadPoolExecutor(max_workers=min(core.REPROCESS_WORKERS, total)) as executor:
+                # Nom de fichier calcule une fois par PDF, reutilise dans les messages d'erreur.
+                futures = {
+                    executor.submit(_process_file, file_path): Path(file_path).name
+                    for file_path in file_paths
+                }
+                for future in as_completed(futures):
+                    pdf_name = futures[future]
+                    try:
+                        outcome, message = future.result()
+                    except Exception as exc:
+                        outcome, message = "failed", str(exc)
+                    # Seul ce thread met a jour la progression : pas de verrou necessaire.
+                    progress[outcome] += 1
+                    if message:
+                        errors.append(f"{pdf_name}: {message}")
+                    progress["current"] += 1
+                    # Ecriture de progression limitee a une par intervalle ; l'etat final est ecrit plus bas.
+                    now = time.monotonic()
+                    if now - last_persist >= REPROCESS_PROGRESS_INTERVAL_SECONDS:
+                        core.db_manager.update_job(batch_id, result={"progress": progress, "errors": errors})
+                        last_persist = now
 
             core.db_manager.update_job(
                 batch_id,
@@ -1086,7 +1130,7 @@ async def start_bulletins_reprocess(background_tasks: BackgroundTasks):
                 result={"progress": progress, "errors": errors},
             )
 
-    background_tasks.add_task(run_in_threadpool, _job_runner)
+    background_tasks.add_task(_run_long_job, "reprocess", _job_runner, max_workers=2)
 
     return {
         "batch_id": batch_id,
@@ -0,0 +1,130 @@
+"""Cache partage des reponses API : Redis si REDIS_URL est defini (commun a tous les workers), sinon memoire du processus."""
+
+import logging
+from typing import Any, Optional
+
+import backend.api_v1.core as core
+from backend.api_v1.serialization import dumps, loads
+from backend.api_v1.utils import _cache_clear, _cache_get, _cache_set
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None
+    RedisError = OSError
+
+logger = logging.getLogger("anam.api")
+
+# Politiques de TTL par type de donnees (secondes).
+TTL_SHORT = 10
+TTL_NORMAL = core.API_CACHE_TTL_SECONDS
+TTL_LONG = 300
+# Copie perimee servie pendant le rafraichissement (stale-while-revalidate).
+TTL_STALE = 3600
+_STALE_SUFFIX = ":stale"
+
+_KEY_PREFIX = "anam:"
+_SCAN_BATCH = 500
+_client = None
+
+
+def _get_client():
+    global _client
+    if _client is None and aioredis is not None and core.REDIS_URL:
+        _client = aioredis.from_url(core.REDIS_URL)
+    return _client
+
+
+async def get_value(key: str) -> Any:
+    client = _get_client()
+    if client is None:
+        return _cache_get(key)
+    try:
+        raw = await client.get(_KEY_PREFIX + key)
+    except RedisError as exc:
+        logger.warning("Cache Redis indisponible (%s), repli memoire.", exc)
+        return _cache_get(key)
+    return loads(raw) if raw is not None else None
+
+
+async def get_raw(key: str) -> Optional[bytes]:
+    """Corps JSON deja serialise (voir set_raw), renvoye tel quel sans decodage."""
+    client = _get_client()
+    if client is None:
+        return _cache_get(key)
+    try:
+        return await client.get(_KEY_PREFIX + key)
+    except RedisError as exc:
+        logger.warning("Cache Redis indisponible (%s), repli memoire.", exc)
+        return _cache_get(key)
+
+
+async def set_raw(key: str, body: bytes, ttl: Optional[int] = None) -> None:
+    ttl = TTL_NORMAL if ttl is None else ttl
+    if core.API_CACHE_TTL_SECONDS <= 0 or ttl <= 0:
+        return
+    client = _get_client()
+    if client is None:
+        _cache_set(key, body, ttl=ttl)
+        return
+    try:
+        await client.set(_KEY_PREFIX + key, body, ex=ttl)
+    except RedisError as exc:
+        logger.warning("Cache Redis indisponible (%s), repli memoire.", exc)
+        _cache_set(key, body, ttl=ttl)
+
+
+async def get_stale(key: str) -> Any:
+    """Derniere valeur connue pour key, conservee plus longtemps que la valeur fraiche (stale_ttl)."""
+    return await get_value(key + _STALE_SUFFIX)
+
+
+async def set_value(key: str, value: Any, ttl: Optional[int] = None, stale_ttl: Optional[int] = None) -> None:
+    ttl = TTL_NORMAL if ttl is None else ttl
+    if core.API_CACHE_TTL_SECONDS <= 0 or ttl <= 0:
+        return
+    client = _get_client()
+    if client is None:
+        _cache_set(key, value, ttl=ttl)
+        if stale_ttl:
+            _cache_set(key + _STALE_SUFFIX, value, ttl=stale_ttl)
+        return
+    try:
+        raw = dumps(value)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(_KEY_PREFIX + key, raw, ex=ttl)
+            if stale_ttl:
+                pipe.set(_KEY_PREFIX + key + _STALE_SUFFIX, raw, ex=stale_ttl)
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Cache Redis indisponible (%s), repli memoire.", exc)
+        _cache_set(key, value, ttl=ttl)
+        if stale_ttl:
+            _cache_set(key + _STALE_SUFFIX, value, ttl=stale_ttl)
+
+
+async def clear(prefix: str) -> None:
+    """Invalide toutes les cles commencant par prefix (SCAN + UNLINK par lots, jamais KEYS)."""
+    _cache_clear(prefix)
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        batch = []
+        async for cache_key in client.scan_iter(match=f"{_KEY_PREFIX}{prefix}*", count=_SCAN_BATCH):
+            batch.append(cache_key)
+            if len(batch) >= _SCAN_BATCH:
+                await client.unlink(*batch)
+                batch = []
+        if batch:
+            await client.unlink(*batch)
+    except RedisError as exc:
+        logger.warning("Invalidation Redis impossible pour %s* : %s", prefix, exc)
+
+
+async def close() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
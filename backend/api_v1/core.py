@@ -13,8 +13,8 @@ from typing import Any, Dict, Optional, Tuple
 from fastapi import HTTPException, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
+from backend.api_v1.serialization import ORJSONResponse, dumps as json_dumps
 from backend.api_errors import (
     AppError,
     ErrorCode,
@@ -28,6 +28,8 @@ from backend.utils.database import DatabaseManager
 # Global state
 config: Optional[Config] = None
 db_manager: Optional[DatabaseManager] = None
+# Passe a True en fin de demarrage : les gardes par requete se limitent a ce booleen.
+READY: bool = False
 result_file: Optional[Path] = None
 
 # Security/Auth constants
@@ -42,6 +44,15 @@ AUTO_PIPELINE_ENABLED = os.getenv("AUTO_PIPELINE_ENABLED", "1").lower() in {"1",
 AUTO_PIPELINE_INTERVAL_SECONDS = int(os.getenv("AUTO_PIPELINE_INTERVAL_SECONDS", "3600"))
 AUTO_PIPELINE_STATE_KEY = "auto_pipeline_last_date"
 API_CACHE_TTL_SECONDS = int(os.getenv("API_CACHE_TTL_SECONDS", "30"))
+REDIS_URL = os.getenv("REDIS_URL", "").strip()
+REPROCESS_WORKERS = max(1, int(os.getenv("REPROCESS_WORKERS", "4")))
+# Jetons du threadpool anyio (appels bloquants : SQLite, fichiers) ; au-dela, les requetes attendent dans FastAPI.
+API_THREADPOOL_SIZE = max(1, int(os.getenv("API_THREADPOOL_SIZE", str(max(8, 2 * (os.cpu_count() or 1))))))
+UPLOAD_WORKERS = max(1, int(os.getenv("UPLOAD_WORKERS", str(min(4, os.cpu_count() or 1)))))
+UPLOAD_MAX_ZIP_MEMBER_BYTES = int(os.getenv("UPLOAD_MAX_ZIP_MEMBER_MB", "100")) * 1024 * 1024
+UPLOAD_MAX_PDF_BYTES = int(os.getenv("UPLOAD_MAX_PDF_MB", "100")) * 1024 * 1024
+MOORE_MAX_CONCURRENCY = max(1, int(os.getenv("MOORE_MAX_CONC", "8")))
+FILES_ACCEL_REDIRECT_PREFIX = os.getenv("FILES_ACCEL_REDIRECT_PREFIX", "").rstrip("/")
 TEMP_RETENTION_STATE_KEY = "temp_file_retention_days"
 TRACE_ID_HEADER = "X-Trace-Id"
 
@@ -54,7 +65,7 @@ def log_event(level: int, event: str, **fields: Any) -> None:
         "ts": datetime.utcnow().isoformat(),
     }
     payload.update(fields)
-    logger.log(level, json.dumps(payload, ensure_ascii=True))
+    logger.log(level, json_dumps(payload))
 
 def _get_trace_id(request: Request) -> str:
     trace_id = getattr(request.state, "trace_id", None)
@@ -73,7 +84,7 @@ async def app_error_handler(request: Request, exc: AppError):
         details=exc.details,
     )
     log_event(logging.WARNING, "app_error", traceId=trace_id, code=exc.code, status=exc.status)
-    return JSONResponse(status_code=exc.status, content=payload, headers={TRACE_ID_HEADER: trace_id})
+    return ORJSONResponse(status_code=exc.status, content=payload, headers={TRACE_ID_HEADER: trace_id})
 
 async def http_error_handler(request: Request, exc: HTTPException):
     trace_id = _get_trace_id(request)
@@ -87,7 +98,7 @@ async def http_error_handler(request: Request, exc: HTTPException):
         details=details,
     )
     log_event(logging.WARNING, "http_error", traceId=trace_id, code=code, status=exc.status_code)
-    return JSONResponse(status_code=exc.status_code, content=payload, headers={TRACE_ID_HEADER: trace_id})
+    return ORJSONResponse(status_code=exc.status_code, content=payload, headers={TRACE_ID_HEADER: trace_id})
 
 async def validation_error_handler(request: Request, exc: RequestValidationError):
     trace_id = _get_trace_id(request)
@@ -100,7 +111,7 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
         details={"errors": encoded_errors},
     )
     log_event(logging.WARNING, "validation_error", traceId=trace_id, status=422)
-    return JSONResponse(status_code=422, content=payload, headers={TRACE_ID_HEADER: trace_id})
+    return ORJSONResponse(status_code=422, content=payload, headers={TRACE_ID_HEADER: trace_id})
 
 async def unhandled_error_handler(request: Request, exc: Exception):
     trace_id = _get_trace_id(request)
@@ -112,24 +123,44 @@ async def unhandled_error_handler(request: Request, exc: Exception):
         details={},
     )
     log_event(logging.ERROR, "unhandled_error", traceId=trace_id, status=500, error=str(exc))
-    return JSONResponse(status_code=500, content=payload, headers={TRACE_ID_HEADER: trace_id})
+    return ORJSONResponse(status_code=500, content=payload, headers={TRACE_ID_HEADER: trace_id})
+
+TOKEN_VERSION_PREFIX = "v2."
+
+def _blake2b_key() -> bytes:
+    secret = AUTH_SECRET.encode("utf-8")
+    # blake2b accepte au plus 64 octets de cle : les secrets plus longs sont d'abord condenses.
+    return secret if len(secret) <= 64 else hashlib.blake2b(secret, digest_size=64).digest()
+
+def _token_signature(payload_b64: str) -> str:
+    return hashlib.blake2b(payload_b64.encode("utf-8"), key=_blake2b_key(), digest_size=32).hexdigest()
+
+def _legacy_token_signature(payload_b64: str) -> str:
+    return hmac.new(AUTH_SECRET.encode("utf-8"), payload_b64.encode("utf-8"), hashlib.sha256).hexdigest()
 
 def _generate_token(username: str):
     expires_at = int(time.time()) + TOKEN_VALIDITY_SECONDS
     payload = {"u": username, "exp": expires_at}
     encoded_payload = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).decode("utf-8").rstrip("=")
-    signature = hmac.new(AUTH_SECRET.encode("utf-8"), encoded_payload.encode("utf-8"), hashlib.sha256).hexdigest()
-    token = f"{encoded_payload}.{signature}"
+    signature = _token_signature(encoded_payload)
+    token = f"{TOKEN_VERSION_PREFIX}{encoded_payload}.{signature}"
     return token, expires_at
 
 
 # Auth Helpers
 def _decode_token(token: str) -> dict:
+    # Les tokens sans prefixe de version (HMAC-SHA256) restent acceptes jusqu'a leur expiration.
+    is_current = token.startswith(TOKEN_VERSION_PREFIX)
+    if is_current:
+        token = token[len(TOKEN_VERSION_PREFIX):]
     try:
         payload_b64, signature = token.split(".", 1)
     except ValueError:
         raise HTTPException(status_code=401, detail="Format de token invalide.")
-    expected_signature = hmac.new(AUTH_SECRET.encode("utf-8"), payload_b64.encode("utf-8"), hashlib.sha256).hexdigest()
+    if is_current:
+        expected_signature = _token_signature(payload_b64)
+    else:
+        expected_signature = _legacy_token_signature(payload_b64)
     if not hmac.compare_digest(signature, expected_signature):
         raise HTTPException(status_code=401, detail="Signature de token invalide.")
     padded = payload_b64 + "=" * (-len(payload_b64) % 4)
@@ -139,7 +170,16 @@ def _decode_token(token: str) -> dict:
     except Exception:
         raise HTTPException(status_code=401, detail="Decodage du token impossible.")
 
+# Tokens deja verifies -> (utilisateur, expiration) ; evite HMAC + base64 + JSON a chaque requete.
+_TOKEN_CACHE: Dict[str, Tuple[str, int]] = {}
+_TOKEN_CACHE_MAX_SIZE = 1024
+
 def _verify_token(token: str) -> Tuple[str, int]:
+    cached = _TOKEN_CACHE.get(token)
+    if cached is not None:
+        if cached[1] >= int(time.time()):
+            return cached
+        _TOKEN_CACHE.pop(token, None)
     data = _decode_token(token)
     username = data.get("u")
     expires_at = data.get("exp")
@@ -147,7 +187,14 @@ def _verify_token(token: str) -> Tuple[str, int]:
         raise HTTPException(status_code=401, detail="Token incomplet.")
     if int(expires_at) < int(time.time()):
         raise HTTPException(status_code=401, detail="Token expire.")
-    return username, int(expires_at)
+    verified = (username, int(expires_at))
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+        try:
+            _TOKEN_CACHE.pop(next(iter(_TOKEN_CACHE)), None)
+        except (StopIteration, RuntimeError):
+            pass
+    _TOKEN_CACHE[token] = verified
+    return verified
 
 def _get_current_user(authorization: Optional[str]) -> Tuple[str, int]:
     if not authorization or not authorization.lower().startswith("bearer "):
@@ -155,8 +202,8 @@ def _get_current_user(authorization: Optional[str]) -> Tuple[str, int]:
     token = authorization.split(" ", 1)[1].strip()
     return _verify_token(token)
 
-def _ensure_db_ready():
-    if db_manager is None:
+def _ensure_db_ready() -> DatabaseManager:
+    if not READY:
         raise HTTPException(
             status_code=503,
             detail={
@@ -164,9 +211,10 @@ def _ensure_db_ready():
                 "message": "Database not initialized.",
             },
         )
+    return db_manager  # type: ignore[return-value]
 
 def _ensure_services_ready():
-    if config is None or db_manager is None:
+    if not READY:
         raise HTTPException(
             status_code=503,
             detail={
@@ -175,7 +223,7 @@ def _ensure_services_ready():
             },
         )
 
-def _get_auth_users() -> Dict[str, str]:
+def _load_auth_users() -> Dict[str, str]:
     users: Dict[str, str] = {}
     auth_users = os.getenv("AUTH_USERS") or AUTH_USERS
     if auth_users:
@@ -196,7 +244,26 @@ def _get_auth_users() -> Dict[str, str]:
         users.setdefault(auth_username, auth_password)
     return users
 
+_AUTH_USERS_CACHE: Optional[Dict[str, str]] = None
+_auth_ready = False
+
+def _get_auth_users() -> Dict[str, str]:
+    global _AUTH_USERS_CACHE
+    if _AUTH_USERS_CACHE is None:
+        _AUTH_USERS_CACHE = _load_auth_users()
+    return _AUTH_USERS_CACHE
+
+def reload_auth_users() -> Dict[str, str]:
+    """Relit les utilisateurs definis dans l'environnement (apres chargement du .env par exemple)."""
+    global _AUTH_USERS_CACHE, _auth_ready
+    _AUTH_USERS_CACHE = _load_auth_users()
+    _auth_ready = False
+    return _AUTH_USERS_CACHE
+
 def _ensure_auth_config():
+    global _auth_ready
+    if _auth_ready:
+        return
     has_db_users = False
     if db_manager is not None:
         try:
@@ -211,3 +278,4 @@ def _ensure_auth_config():
                 "message": "AUTH_USERNAME/AUTH_PASSWORD or AUTH_USERS must be set.",
             },
         )
+    _auth_ready = True
@@ -1,17 +1,24 @@
-import io
-import json
+import asyncio
+import hashlib
 import logging
+import mimetypes
+import os
 import re
+import threading
+import time
 import unicodedata
-import uuid
 import zipfile
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, File, HTTPException, Query, UploadFile, Path as ApiPath
+from fastapi import APIRouter, BackgroundTasks, File, HTTPException, Query, Request, UploadFile, Path as ApiPath
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, Field
 
 from backend.api_v1.models import (
@@ -21,10 +28,12 @@ from backend.api_v1.models import (
 )
 import backend.api_v1.core as core
 from backend.api_v1.core import _ensure_services_ready, _ensure_db_ready, ErrorCode
+from backend.api_v1.serialization import ORJSONResponse, ORJSONRoute, loads as json_loads
 from backend.api_v1.utils import (
     _resolve_scrape_output_dir,
     _sanitize_filename,
-    _serialize_temperature_payload
+    _serialize_temperature_payload,
+    _uuid7,
 )
 from backend.modules.pdf_scrap import MeteoBurkinaScraper, ManifestStore, ScrapeConfig
 from backend.modules.pdf_extractor import PDFExtractor
@@ -34,7 +43,21 @@ from backend.modules.icon_classifier import IconClassifier
 from backend.modules.data_integrator import DataIntegrator
 
 logger = logging.getLogger("anam.api")
-router = APIRouter(tags=["data_management"])
+router = APIRouter(
+    tags=["data_management"],
+    default_response_class=ORJSONResponse,
+    route_class=ORJSONRoute,
+)
+
+_FILE_META_RE = re.compile(
+    r"Bulletin_du_(?P<d>\d{1,2})_(?P<m>[A-Za-z\u00c0-\u017f]+)_(?P<y>\d{4})"
+    r"|(?P<obs>(?i:observed|observation))"
+    r"|(?P<fc>(?i:forecast|prevision))"
+)
+_FORECAST_NAME_RE = re.compile(r"forecast|pr[e\u00e9]vision", re.IGNORECASE)
+_OBSERVATION_NAME_RE = re.compile(r"obs", re.IGNORECASE)  # couvre aussi observed / observation
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_SOURCE_CLEAN_RE = re.compile(r"[^a-zA-Z0-9_-]+")
 
 _MONTHS_FR = {
     "janvier": 1,
@@ -52,16 +75,23 @@ _MONTHS_FR = {
 }
 
 
+_ACCENT_TABLE = str.maketrans(
+    "àâäéèêëîïôöùûüçÀÂÄÉÈÊËÎÏÔÖÙÛÜÇ",
+    "aaaeeeeiioouuucAAAEEEEIIOOUUUC",
+)
+
+
 def _strip_accents(value: str) -> str:
-    normalized = unicodedata.normalize("NFD", value)
+    if value.isascii():
+        return value
+    translated = value.translate(_ACCENT_TABLE)
+    if translated.isascii():
+        return translated
+    normalized = unicodedata.normalize("NFD", translated)
     return "".join(ch for ch in normalized if unicodedata.category(ch) != "Mn")
 
 
-def _parse_bulletin_date(filename: str) -> Optional[str]:
-    match = re.search(r"Bulletin_du_(\d{1,2})_([A-Za-z\u00c0-\u017f]+)_(\d{4})", filename)
-    if not match:
-        return None
-    day_str, month_raw, year_str = match.groups()
+def _bulletin_date_from_parts(day_str: str, month_raw: str, year_str: str) -> Optional[str]:
     month_key = _strip_accents(month_raw).lower()
     month_num = _MONTHS_FR.get(month_key)
     if not month_num:
@@ -72,24 +102,44 @@ def _parse_bulletin_date(filename: str) -> Optional[str]:
         return None
 
 
-def _map_type_from_name(filename: str) -> Optional[str]:
-    lowered = filename.lower()
-    if "observed" in lowered or "observation" in lowered:
-        return "observed"
-    if "forecast" in lowered or "prevision" in lowered:
-        return "forecast"
-    return None
+@lru_cache(maxsize=4096)
+def _file_metadata(filename: str) -> tuple[Optional[str], Optional[str]]:
+    """Date du bulletin et type de carte extraits en un seul parcours du nom."""
+    date_value: Optional[str] = None
+    date_seen = False
+    observed = forecast = False
+    for match in _FILE_META_RE.finditer(filename):
+        if match.lastgroup == "y":
+            if not date_seen:
+                date_seen = True
+                date_value = _bulletin_date_from_parts(match["d"], match["m"], match["y"])
+        elif match.lastgroup == "obs":
+            observed = True
+        else:
+            forecast = True
+    map_type = "observed" if observed else ("forecast" if forecast else None)
+    return date_value, map_type
 
 
 def _infer_bulletin_type_from_filename(filename: str) -> Optional[str]:
-    lowered = filename.lower()
-    if "forecast" in lowered or "prevision" in lowered or "prévision" in lowered:
+    if _FORECAST_NAME_RE.search(filename):
         return "forecast"
-    if "observed" in lowered or "observation" in lowered or "obs" in lowered:
+    if _OBSERVATION_NAME_RE.search(filename):
         return "observation"
     return None
 
 
+def _is_valid_iso_date(value: str) -> bool:
+    try:
+        if _ISO_DATE_RE.fullmatch(value):
+            date.fromisoformat(value)
+        else:
+            datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
 def _normalize_manual_map_type(value: str) -> Optional[str]:
     lowered = value.lower().strip()
     if lowered in {"observed", "observation", "obs"}:
@@ -100,10 +150,125 @@ def _normalize_manual_map_type(value: str) -> Optional[str]:
 
 
 def _sanitize_source(value: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9_-]+", "_", value.strip())
+    cleaned = _SOURCE_CLEAN_RE.sub("_", value.strip())
     return cleaned.strip("_") or "manual"
 
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _open_new_file(target_path: Path):
+    """Cree le fichier en exclusif ; suffixe _1, _2... si le nom est deja pris (meme nom, meme seconde)."""
+    candidate = target_path
+    for attempt in range(1, 1000):
+        try:
+            return open(candidate, "xb"), candidate
+        except FileExistsError:
+            candidate = target_path.with_name(f"{target_path.stem}_{attempt}{target_path.suffix}")
+        except FileNotFoundError:
+            # Dossier cree au demarrage (Config) ; recree seulement s'il a ete supprime entre-temps.
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+    raise FileExistsError(str(target_path))
+
+
+def _copy_stream_to_path(source, target_path: Path, hasher=None) -> tuple[int, Path]:
+    """Copie un flux binaire par blocs de 1 Mo ; retourne (octets ecrits, chemin effectivement cree)."""
+    written = 0
+    buffer, target_path = _open_new_file(target_path)
+    readinto = getattr(source, "readinto", None)
+    try:
+        with buffer:
+            if readinto is None:
+                while True:
+                    chunk = source.read(_UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    buffer.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    written += len(chunk)
+            else:
+                # Tampon unique reutilise : pas de nouvel objet bytes de 1 Mo par bloc.
+                block = bytearray(_UPLOAD_CHUNK_SIZE)
+                view = memoryview(block)
+                while True:
+                    size = readinto(block)
+                    if not size:
+                        break
+                    buffer.write(view[:size])
+                    if hasher is not None:
+                        hasher.update(view[:size])
+                    written += size
+    except Exception:
+        target_path.unlink(missing_ok=True)
+        raise
+    return written, target_path
+
+
+def _spooled_size(source) -> Optional[int]:
+    """Taille du fichier temporaire multipart sans lire son contenu (None si non seekable)."""
+    try:
+        source.seek(0, os.SEEK_END)
+        size = source.tell()
+        source.seek(0)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return size
+
+
+def _upload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail={
+            "code": ErrorCode.UPLOAD_INVALID.value,
+            "message": "Le fichier dépasse la taille maximale autorisée.",
+        },
+    )
+
+
+# Version du pipeline d'extraction : a incrementer quand le code OCR/detection change le resultat.
+_EXTRACTION_VERSION = "1"
+# Parametres d'environnement qui modifient le resultat de l'extraction (hors timeouts/retries).
+_EXTRACTION_ENV_KEYS = (
+    "PDF_MIN_MAP_WIDTH",
+    "PDF_MIN_MAP_HEIGHT",
+    "PDF_MAX_MAP_WIDTH",
+    "PDF_MAX_MAP_HEIGHT",
+    "ROBOFLOW_MODEL_ID",
+    "ROBOFLOW_WORKFLOW_ON_MAPS",
+    "WORKFLOW_ASSOCIATION_MAX_DIST_PX",
+    "SINGLE_MAP_FORECAST_HOUR",
+    "TEMPERATURE_DROP_UNKNOWN",
+    "TEMPERATURE_ROI_TOLERANCE_PX",
+    "TEMPERATURE_OCR_UPSCALE",
+    "TEMPERATURE_COLOR_MASK_UPSCALE",
+    "ROI_BASE_WIDTH",
+    "ROI_BASE_HEIGHT",
+)
+
+
+@lru_cache(maxsize=1)
+def _extraction_fingerprint() -> str:
+    """Empreinte de la config d'extraction (version, ROI, modele, parametres), figee comme les extracteurs partages."""
+    hasher = hashlib.sha1(_EXTRACTION_VERSION.encode("utf-8"))
+    for key in _EXTRACTION_ENV_KEYS:
+        hasher.update(f"{key}={os.getenv(key, '')}\n".encode("utf-8"))
+    try:
+        hasher.update(Path(core.config.roi_config_path).read_bytes())
+    except (AttributeError, OSError, TypeError):
+        pass
+    return hasher.hexdigest()[:16]
+
+
+def _reuse_stored_pdf(target_path: Path, previous: Optional[dict]) -> Path:
+    """Contenu deja stocke (meme SHA-1) : supprime la nouvelle copie et renvoie le fichier existant."""
+    previous_path = (previous or {}).get("pdf_path")
+    if not previous_path or previous_path == str(target_path) or not os.path.isfile(previous_path):
+        return target_path
+    target_path.unlink(missing_ok=True)
+    return Path(previous_path)
+
+
 class ManualMetricsStation(BaseModel):
     nom: Optional[str] = None
     tmin: Optional[float] = None
@@ -129,6 +294,170 @@ class ManualMetricsIngestResponse(BaseModel):
     skipped: int
 
 
+# Lots annules dans ce processus : raccourci qui evite de charger les extracteurs pour rien.
+# La base reste l'autorite (claim_job) ; l'id est retire des que le dernier runner du lot a fini.
+_CANCELED_BATCHES: set = set()
+_CANCELED_BATCHES_LOCK = threading.Lock()
+
+
+def _is_batch_canceled(batch_id: str) -> bool:
+    with _CANCELED_BATCHES_LOCK:
+        return batch_id in _CANCELED_BATCHES
+
+
+def _forget_canceled_batch(batch_id: str) -> None:
+    with _CANCELED_BATCHES_LOCK:
+        _CANCELED_BATCHES.discard(batch_id)
+
+
+# Extracteurs partages entre jobs : leur etat est fige apres l'init (config ROI, parametres env).
+# L'OCR passe par pytesseract (sous-processus) : aucun modele n'est charge en memoire par instance.
+_PDF_EXTRACTOR: Optional[PDFExtractor] = None
+_TEMP_EXTRACTOR: Optional[TemperatureExtractor] = None
+_WORKFLOW_TEMP_EXTRACTOR: Optional[WorkflowTemperatureExtractor] = None
+_ICON_CLASSIFIER: Optional[IconClassifier] = None
+_EXTRACTOR_LOCK = threading.Lock()
+
+
+def _get_extractors() -> tuple[PDFExtractor, TemperatureExtractor]:
+    global _PDF_EXTRACTOR, _TEMP_EXTRACTOR
+    if _PDF_EXTRACTOR is None or _TEMP_EXTRACTOR is None:
+        with _EXTRACTOR_LOCK:
+            if _PDF_EXTRACTOR is None:
+                _PDF_EXTRACTOR = PDFExtractor(
+                    core.config.pdf_directory,
+                    core.config.output_directory
+                )
+            if _TEMP_EXTRACTOR is None:
+                _TEMP_EXTRACTOR = TemperatureExtractor(roi_config_path=core.config.roi_config_path)
+    return _PDF_EXTRACTOR, _TEMP_EXTRACTOR
+
+
+def _get_reprocess_extractors() -> tuple[PDFExtractor, WorkflowTemperatureExtractor, IconClassifier]:
+    """Extracteurs de la re-extraction, partages entre ses threads comme ceux du televersement."""
+    global _WORKFLOW_TEMP_EXTRACTOR, _ICON_CLASSIFIER
+    pdf_extractor, _ = _get_extractors()
+    if _WORKFLOW_TEMP_EXTRACTOR is None or _ICON_CLASSIFIER is None:
+        with _EXTRACTOR_LOCK:
+            if _WORKFLOW_TEMP_EXTRACTOR is None:
+                _WORKFLOW_TEMP_EXTRACTOR = WorkflowTemperatureExtractor(roi_config_path=core.config.roi_config_path)
+            if _ICON_CLASSIFIER is None:
+                _ICON_CLASSIFIER = IconClassifier(roi_config_path=core.config.roi_config_path)
+    return pdf_extractor, _WORKFLOW_TEMP_EXTRACTOR, _ICON_CLASSIFIER
+
+
+# Pool borne partage par toutes les extractions de televersement (OCR / Roboflow liberent le GIL).
+_UPLOAD_POOL: Optional[ThreadPoolExecutor] = None
+_UPLOAD_POOL_LOCK = threading.Lock()
+
+
+def _get_upload_pool() -> ThreadPoolExecutor:
+    global _UPLOAD_POOL
+    if _UPLOAD_POOL is None:
+        with _UPLOAD_POOL_LOCK:
+            if _UPLOAD_POOL is None:
+                _UPLOAD_POOL = ThreadPoolExecutor(
+                    max_workers=core.UPLOAD_WORKERS,
+                    thread_name_prefix="upload-batch",
+                )
+    return _UPLOAD_POOL
+
+
+def _submit_upload_jobs(runners: List, batch_id: Optional[str] = None) -> None:
+    pool = _get_upload_pool()
+    futures = [pool.submit(runner) for runner in runners]
+    if batch_id is None or not futures:
+        return
+    remaining = [len(futures)]
+    remaining_lock = threading.Lock()
+
+    def _on_done(_future) -> None:
+        with remaining_lock:
+            remaining[0] -= 1
+            finished = remaining[0] == 0
+        if finished:
+            _forget_canceled_batch(batch_id)
+
+    for future in futures:
+        future.add_done_callback(_on_done)
+
+
+def shutdown_upload_pool() -> None:
+    global _UPLOAD_POOL
+    with _UPLOAD_POOL_LOCK:
+        if _UPLOAD_POOL is not None:
+            _UPLOAD_POOL.shutdown(wait=False, cancel_futures=True)
+            _UPLOAD_POOL = None
+
+
+_FILE_CACHE_CONTROL = "public, max-age=300"
+
+
+class _LargeChunkFileResponse(FileResponse):
+    # Blocs de 256 Kio (Range deja gere par Starlette) : moins d'allers-retours pour les images de cartes.
+    chunk_size = 256 * 1024
+
+
+_SERVE_CATEGORIES = frozenset({"maps", "pdf_images"})
+
+
+@lru_cache(maxsize=8)
+def _serve_base_dir(output_directory: Path, category: str) -> str:
+    return os.path.normpath(os.path.join(output_directory, "temp", category))
+
+
+def warm_upload_extractors() -> None:
+    """Construit les extracteurs partages hors requete (appele au demarrage)."""
+    try:
+        _get_extractors()
+    except Exception as exc:
+        logger.warning("Pre-chargement des extracteurs impossible : %s", exc)
+
+
+_JSON_LISTING_CACHE: dict = {}
+_MANIFEST_CACHE: dict = {}
+
+
+def _json_tree_signature(base_dir: Path) -> tuple:
+    """mtime de chaque dossier de l'arborescence : change a chaque ajout/suppression/renommage de fichier."""
+    signature = []
+    stack = [str(base_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            signature.append((current, os.stat(current).st_mtime_ns))
+            with os.scandir(current) as entries:
+                stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+    return tuple(sorted(signature))
+
+
+@lru_cache(maxsize=4)
+def _json_base_dir(project_root: Path) -> str:
+    return str((project_root / "json").resolve())
+
+
+def _fmt_iso(ts: float) -> str:
+    """Horodatage UTC ISO 8601 a la seconde, sans objet datetime intermediaire."""
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % time.gmtime(ts)[:6]
+
+
+def _walk_json(base: str):
+    """Parcours iteratif via os.scandir : renvoie les DirEntry des fichiers .json."""
+    stack = [base]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        yield entry
+        except OSError:
+            continue
+
+
 @router.get("/json-metrics/files")
 async def list_json_metrics_files():
     """Liste les fichiers JSON de métriques disponibles dans backend/json."""
@@ -136,48 +465,71 @@ async def list_json_metrics_files():
     if base_dir is None or not base_dir.exists():
         return {"files": [], "total": 0}
 
+    # Listing reutilise tant que l'arborescence n'a pas change (et dans la limite du TTL du cache API).
+    signature = _json_tree_signature(base_dir)
+    cached = _JSON_LISTING_CACHE.get(base_dir)
+    if (
+        cached
+        and cached[0] == signature
+        and time.monotonic() - cached[1] < core.API_CACHE_TTL_SECONDS
+    ):
+        return cached[2]
+
+    base = str(base_dir)
     files: List[dict] = []
-    for json_path in sorted(base_dir.rglob("*.json")):
+    for entry in _walk_json(base):
         try:
-            stat = json_path.stat()
+            stat = entry.stat()
         except OSError:
             continue
-        rel_path = json_path.relative_to(base_dir).as_posix()
-        date_value = _parse_bulletin_date(json_path.name)
+        rel_path = os.path.relpath(entry.path, base).replace(os.sep, "/")
+        date_value, map_type = _file_metadata(entry.name)
         files.append(
             {
                 "path": rel_path,
-                "name": json_path.name,
+                "name": entry.name,
                 "size_bytes": stat.st_size,
-                "modified_at": datetime.utcfromtimestamp(stat.st_mtime).isoformat() + "Z",
+                "modified_at": _fmt_iso(stat.st_mtime),
                 "date": date_value,
                 "month": date_value[:7] if date_value else None,
                 "year": int(date_value[:4]) if date_value else None,
-                "map_type": _map_type_from_name(json_path.name),
+                "map_type": map_type,
             }
         )
+    files.sort(key=lambda item: item["path"])
 
-    return {"files": files, "total": len(files)}
+    response = {"files": files, "total": len(files)}
+    if core.API_CACHE_TTL_SECONDS > 0:
+        _JSON_LISTING_CACHE[base_dir] = (signature, time.monotonic(), response)
+    return response
 
 
 @router.get("/json-metrics/file")
 async def get_json_metrics_file(path: str = Query(..., min_length=1)):
     """Retourne le contenu d'un fichier JSON de métriques."""
-    base_dir = (core.config.project_root / "json") if core.config else None
-    if base_dir is None:
+    if core.config is None:
         raise HTTPException(status_code=500, detail="Configuration indisponible.")
 
-    base_dir = base_dir.resolve()
-    target = (base_dir / path).resolve()
-    if base_dir != target and base_dir not in target.parents:
+    # Controle lexical : seule la racine est resolue (une fois), pas de realpath par requete.
+    base_dir = _json_base_dir(core.config.project_root)
+    safe = os.path.normpath(path)
+    if os.path.isabs(safe) or safe == ".." or safe.startswith(".." + os.sep):
+        raise HTTPException(status_code=400, detail="Chemin invalide.")
+    target = os.path.join(base_dir, safe)
+    if not target.startswith(base_dir + os.sep):
         raise HTTPException(status_code=400, detail="Chemin invalide.")
-    if target.suffix.lower() != ".json":
+    if not target.lower().endswith(".json"):
         raise HTTPException(status_code=400, detail="Seuls les fichiers JSON sont autorisés.")
-    if not target.exists():
-        raise HTTPException(status_code=404, detail="Fichier introuvable.")
 
     try:
-        payload = json.loads(target.read_text(encoding="utf-8"))
+        with open(target, "rb") as handle:
+            raw = handle.read()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Fichier introuvable.")
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"Lecture JSON impossible: {exc}")
+    try:
+        payload = json_loads(raw)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Lecture JSON impossible: {exc}")
 
@@ -191,33 +543,31 @@ async def ingest_json_metrics(payload: ManualMetricsIngestRequest):
     if core.db_manager is None:
         raise HTTPException(status_code=500, detail="Base de donnees indisponible.")
 
-    inserted = 0
-    updated = 0
     skipped = 0
     source = payload.source or "manual"
     source_key = _sanitize_source(source)
 
+    # Pre-passe pure Python : toutes les lignes sont construites avant les ecritures groupees.
+    bulletin_rows: List[tuple] = []
+    payload_rows: List[tuple] = []
+    map_types: dict = {}
     for index, entry in enumerate(payload.entries):
-        try:
-            datetime.strptime(entry.date, "%Y-%m-%d")
-        except ValueError:
+        if not _is_valid_iso_date(entry.date):
             skipped += 1
             continue
 
-        bulletin_type = _normalize_manual_map_type(entry.mapType or "")
+        map_type_raw = entry.mapType or ""
+        bulletin_type = map_types.get(map_type_raw)
+        if bulletin_type is None and map_type_raw not in map_types:
+            bulletin_type = map_types[map_type_raw] = _normalize_manual_map_type(map_type_raw)
         if not bulletin_type:
             skipped += 1
             continue
 
         pdf_path = f"manual-import/{source_key}/{entry.date}-{bulletin_type}-{index}.json"
-        if not core.db_manager.has_bulletin_for_pdf(pdf_path):
-            core.db_manager.insert_bulletin(
-                entry.date,
-                bulletin_type,
-                file_path=pdf_path,
-                title=f"Manual import {entry.date} {bulletin_type}",
-            )
-            inserted += 1
+        bulletin_rows.append(
+            (entry.date, bulletin_type, pdf_path, f"Manual import {entry.date} {bulletin_type}")
+        )
 
         payload_stations: List[dict] = []
         for station in entry.stations:
@@ -242,8 +592,14 @@ async def ingest_json_metrics(payload: ManualMetricsIngestRequest):
             "source": entry.source or source,
             "stations": payload_stations,
         }
-        core.db_manager.upsert_bulletin_payload(pdf_path, payload_dict)
-        updated += 1
+        payload_rows.append((pdf_path, payload_dict))
+
+    # Trois operations groupees au lieu de 2 a 3 allers-retours par entree.
+    existing = core.db_manager.bulk_has_bulletins([row[2] for row in bulletin_rows])
+    inserted = core.db_manager.bulk_insert_bulletins(
+        [row for row in bulletin_rows if row[2] not in existing]
+    )
+    updated = core.db_manager.bulk_upsert_bulletin_payloads(payload_rows)
 
     return ManualMetricsIngestResponse(
         inserted_bulletins=inserted,
@@ -299,18 +655,27 @@ async def get_scrape_manifest(output_dir: Optional[str] = None):
     """Retourner le manifeste de scraping pour inspection."""
     manifest_dir = _resolve_scrape_output_dir(output_dir)
     manifest_path = manifest_dir / "scrape_manifest.json"
-    if not manifest_path.exists():
+    try:
+        stat = manifest_path.stat()
+    except OSError:
         return {
             "output_dir": str(manifest_dir.resolve()),
             "exists": False,
             "manifest": {"version": 1, "items": {}},
         }
     try:
-        store = ManifestStore(manifest_path)
+        # Manifeste relu uniquement quand le scraping l'a reecrit (mtime/taille).
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _MANIFEST_CACHE.get(manifest_path)
+        if cached and cached[0] == signature:
+            data = cached[1]
+        else:
+            data = (await run_in_threadpool(ManifestStore, manifest_path)).data
+            _MANIFEST_CACHE[manifest_path] = (signature, data)
         return {
             "output_dir": str(manifest_dir.resolve()),
             "exists": True,
-            "manifest": store.data,
+            "manifest": data,
         }
     except Exception as exc:
         raise HTTPException(
@@ -322,15 +687,27 @@ async def get_scrape_manifest(output_dir: Optional[str] = None):
         )
 
 
-@router.post("/upload-bulletin", response_model=Union[UploadResponse, UploadJobResponse])
+# Reponses deja mises en forme par les handlers : pas de revalidation Pydantic, le modele sert a la doc OpenAPI.
+@router.post(
+    "/upload-bulletin",
+    response_model=None,
+    responses={200: {"model": UploadResponse}, 202: {"model": UploadJobResponse}},
+)
 async def upload_bulletin(
+    request: Request,
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     async_job: bool = Query(False, alias="async"),
+    force: bool = Query(False),
 ):
     """Téléverser un PDF de bulletin et exécuter l'extraction de température."""
     _ensure_services_ready()
 
+    # Sortie rapide sur l'en-tete ; la taille reelle est reverifiee sur le spool (envoi chunked ou sans en-tete).
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > core.UPLOAD_MAX_PDF_BYTES:
+        raise _upload_too_large()
+
     if not file.filename:
         raise HTTPException(
             status_code=400,
@@ -348,14 +725,9 @@ async def upload_bulletin(
             },
         )
 
-    assert core.config is not None
-    target_dir = core.config.pdf_directory
-    target_dir.mkdir(parents=True, exist_ok=True)
-    filename = _sanitize_filename(file.filename)
-    target_path = target_dir / filename
-
-    data = await file.read()
-    if not data:
+    # Taille mesuree sur le spool, sans lecture ni aller-retour disque.
+    spooled_size = _spooled_size(file.file)
+    if spooled_size == 0:
         raise HTTPException(
             status_code=400,
             detail={
@@ -363,10 +735,17 @@ async def upload_bulletin(
                 "message": "Le fichier est vide.",
             },
         )
+    if spooled_size is not None and spooled_size > core.UPLOAD_MAX_PDF_BYTES:
+        raise _upload_too_large()
 
+    assert core.config is not None
+    target_dir = core.config.pdf_directory
+    filename = _sanitize_filename(file.filename)
+    target_path = target_dir / filename
+
+    hasher = hashlib.sha1()
     try:
-        with open(target_path, "wb") as buffer:
-            buffer.write(data)
+        written, target_path = await run_in_threadpool(_copy_stream_to_path, file.file, target_path, hasher)
     except Exception as exc:
         raise HTTPException(
             status_code=500,
@@ -375,17 +754,35 @@ async def upload_bulletin(
                 "message": f"Impossible de sauvegarder le PDF : {exc}",
             },
         )
+    if not written:
+        target_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": ErrorCode.UPLOAD_EMPTY.value,
+                "message": "Le fichier est vide.",
+            },
+        )
+
+    # Contenu deja traite (meme SHA-1, meme config d'extraction) : resultat reutilise sauf si force.
+    content_sha1 = hasher.hexdigest()
+    fingerprint = _extraction_fingerprint()
+    previous = (
+        core.db_manager.get_job_results_by_sha1([content_sha1], fingerprint=fingerprint).get(content_sha1)
+        if core.db_manager is not None and not force
+        else None
+    )
+    cached_temperatures = previous.get("temperatures") if previous else None
+    if cached_temperatures is not None:
+        target_path = _reuse_stored_pdf(target_path, previous)
+    filename = target_path.name
 
     def extraction_task():
-        pdf_extractor = PDFExtractor(
-            core.config.pdf_directory,
-            core.config.output_directory
-        )
+        pdf_extractor, temp_extractor = _get_extractors()
         pdf_result = pdf_extractor.process_single_pdf(target_path)
         if not pdf_result:
             raise RuntimeError("Traitement PDF impossible (conversion ou detection).")
-        
-        temp_extractor = TemperatureExtractor(roi_config_path=core.config.roi_config_path)
+
         temperatures = temp_extractor.extract_temperatures([pdf_result])
         return _serialize_temperature_payload(temperatures)
 
@@ -405,27 +802,55 @@ async def upload_bulletin(
             except Exception as exc:
                 core.db_manager.update_job(job_id, status="error", error_message=str(exc))
 
-        background_tasks.add_task(run_in_threadpool, job_runner)
+        background_tasks.add_task(_submit_upload_jobs, [job_runner])
 
     if async_job:
         assert core.db_manager is not None
-        job_id = str(uuid.uuid4())
+        job_id = _uuid7()
         core.db_manager.create_job(
             job_id,
             "upload_bulletin",
-            {"filename": filename, "pdf_path": str(target_path)},
+            {
+                "filename": filename,
+                "pdf_path": str(target_path),
+                "content_sha1": content_sha1,
+                "extractor_fingerprint": fingerprint,
+            },
+            content_sha1=content_sha1,
         )
-        _enqueue_job(job_id, filename, str(target_path))
+        status_value = "pending"
+        if cached_temperatures is not None:
+            core.db_manager.complete_jobs(
+                [
+                    (
+                        job_id,
+                        {"filename": filename, "pdf_path": str(target_path), "temperatures": cached_temperatures},
+                    )
+                ]
+            )
+            status_value = "success"
+        else:
+            _enqueue_job(job_id, filename, str(target_path))
         response = {
             "job_id": job_id,
-            "status": "pending",
+            "status": status_value,
             "filename": filename,
             "pdf_path": str(target_path),
         }
-        return JSONResponse(content=response, status_code=202)
+        return ORJSONResponse(content=response, status_code=202)
+
+    if cached_temperatures is not None:
+        return ORJSONResponse(
+            content={
+                "filename": filename,
+                "pdf_path": str(target_path),
+                "temperatures": cached_temperatures,
+            }
+        )
 
     try:
-        temperatures = await run_in_threadpool(extraction_task)
+        # Meme pool borne que les jobs : les extractions OCR simultanees restent plafonnees.
+        temperatures = await asyncio.wrap_future(_get_upload_pool().submit(extraction_task))
     except Exception as exc:
         raise HTTPException(
             status_code=500,
@@ -435,59 +860,72 @@ async def upload_bulletin(
             },
         )
 
-    return {
-        "filename": filename,
-        "pdf_path": str(target_path),
-        "temperatures": temperatures,
-    }
+    return ORJSONResponse(
+        content={
+            "filename": filename,
+            "pdf_path": str(target_path),
+            "temperatures": temperatures,
+        }
+    )
 
 
 @router.post("/upload-bulletins", response_model=UploadBatchResponse)
 async def upload_bulletins(
     background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
+    force: bool = Query(False),
 ):
     """Téléverser plusieurs bulletins (PDF ou ZIP) et les traiter de manière asynchrone."""
     _ensure_services_ready()
     assert core.config is not None and core.db_manager is not None
 
-    batch_id = str(uuid.uuid4())
+    batch_id = _uuid7()
     jobs: List[UploadJobResponse] = []
-    collected_paths: List[tuple[str, str]] = []
+    collected_paths: List[tuple[str, str, str]] = []
 
-    def _save_bytes(filename_value: str, data: bytes) -> Optional[str]:
-        if not data:
-            return None
+    def _save_stream(filename_value: str, source) -> Optional[tuple[str, str]]:
         target_dir = core.config.pdf_directory
-        target_dir.mkdir(parents=True, exist_ok=True)
         filename_clean = _sanitize_filename(filename_value)
         target_path = target_dir / filename_clean
+        hasher = hashlib.sha1()
         try:
-            with open(target_path, "wb") as buffer:
-                buffer.write(data)
+            written, target_path = _copy_stream_to_path(source, target_path, hasher)
         except Exception:
             return None
-        return str(target_path)
+        if not written:
+            target_path.unlink(missing_ok=True)
+            return None
+        return str(target_path), hasher.hexdigest()
+
+    def _extract_zip(source) -> List[tuple[str, str, str]]:
+        extracted: List[tuple[str, str, str]] = []
+        with zipfile.ZipFile(source) as archive:
+            for member in archive.infolist():
+                if member.is_dir():
+                    continue
+                member_name = Path(member.filename).name
+                if not member_name.lower().endswith(".pdf"):
+                    continue
+                # ZipExtFile borne la sortie a file_size : verifier la taille declaree suffit contre les zip bombs.
+                if member.file_size > core.UPLOAD_MAX_ZIP_MEMBER_BYTES:
+                    logger.warning("Membre ZIP ignore (trop volumineux) : %s (%s octets)", member_name, member.file_size)
+                    continue
+                with archive.open(member) as handle:
+                    saved = _save_stream(member_name, handle)
+                if saved:
+                    extracted.append((member_name, *saved))
+        return extracted
 
     for upload in files:
         if not upload.filename:
             continue
-        raw = await upload.read()
         name_lower = upload.filename.lower()
         if name_lower.endswith(".zip"):
             try:
-                with zipfile.ZipFile(io.BytesIO(raw)) as archive:
-                    for member in archive.infolist():
-                        if member.is_dir():
-                            continue
-                        member_name = Path(member.filename).name
-                        if not member_name.lower().endswith(".pdf"):
-                            continue
-                        with archive.open(member) as handle:
-                            content = handle.read()
-                        saved = _save_bytes(member_name, content)
-                        if saved:
-                            collected_paths.append((member_name, saved))
+                # UploadFile est deja un SpooledTemporaryFile (bascule sur disque) : lecture directe, sans copie memoire.
+                # Decompression et ecritures dans le threadpool pour ne pas bloquer la boucle.
+                await upload.seek(0)
+                collected_paths.extend(await run_in_threadpool(_extract_zip, upload.file))
             except Exception as exc:
                 raise HTTPException(
                     status_code=400,
@@ -499,9 +937,9 @@ async def upload_bulletins(
         else:
             if upload.content_type and "pdf" not in upload.content_type.lower() and not name_lower.endswith(".pdf"):
                 continue
-            saved = _save_bytes(upload.filename, raw)
+            saved = await run_in_threadpool(_save_stream, upload.filename, upload.file)
             if saved:
-                collected_paths.append((upload.filename, saved))
+                collected_paths.append((upload.filename, *saved))
 
     if not collected_paths:
         raise HTTPException(
@@ -512,32 +950,106 @@ async def upload_bulletins(
             },
         )
 
+    # Dedoublonnage par SHA-1 : doublons du lot signales "skipped", contenus deja traites (meme config
+    # d'extraction) repris de l'historique sauf si force.
+    fingerprint = _extraction_fingerprint()
+    previous_results = (
+        {}
+        if force
+        else core.db_manager.get_job_results_by_sha1([row[2] for row in collected_paths], fingerprint=fingerprint)
+    )
+    first_by_hash: dict = {}
     job_ids: List[str] = []
-    for original_name, pdf_path_value in collected_paths:
-        job_id = str(uuid.uuid4())
+    job_rows: List[tuple] = []
+    completed_rows: List[tuple] = []
+    skipped_rows: List[tuple] = []
+    runners: List = []
+    for original_name, pdf_path_value, content_sha1 in collected_paths:
+        first = first_by_hash.get(content_sha1)
+        if first is not None:
+            # Copie identique dans le meme lot : un seul fichier traite, le doublon est signale.
+            first_job_id, first_name, first_pdf_path = first
+            duplicate_filename = Path(original_name).name
+            Path(pdf_path_value).unlink(missing_ok=True)
+            job_id = _uuid7()
+            job_ids.append(job_id)
+            job_rows.append(
+                (
+                    job_id,
+                    "upload_bulletin",
+                    {
+                        "filename": duplicate_filename,
+                        "pdf_path": first_pdf_path,
+                        "batch_id": batch_id,
+                        "content_sha1": content_sha1,
+                        "duplicate_of": first_job_id,
+                    },
+                )
+            )
+            skipped_rows.append((job_id, f"Ignoré : doublon de {first_name}."))
+            jobs.append(
+                {
+                    "job_id": job_id,
+                    "status": "skipped",
+                    "filename": duplicate_filename,
+                    "pdf_path": first_pdf_path,
+                    "duplicate_of": first_job_id,
+                }
+            )
+            continue
+        previous = previous_results.get(content_sha1)
+        cached_temperatures = previous.get("temperatures") if previous else None
+        if cached_temperatures is not None:
+            pdf_path_value = str(_reuse_stored_pdf(Path(pdf_path_value), previous))
+        job_id = _uuid7()
         job_ids.append(job_id)
         filename_value = Path(pdf_path_value).name
-        core.db_manager.create_job(
-            job_id,
-            "upload_bulletin",
-            {"filename": filename_value, "pdf_path": pdf_path_value, "batch_id": batch_id},
+        first_by_hash[content_sha1] = (job_id, Path(original_name).name, pdf_path_value)
+        job_rows.append(
+            (
+                job_id,
+                "upload_bulletin",
+                {
+                    "filename": filename_value,
+                    "pdf_path": pdf_path_value,
+                    "batch_id": batch_id,
+                    "content_sha1": content_sha1,
+                    "extractor_fingerprint": fingerprint,
+                },
+                content_sha1,
+            )
         )
+        if cached_temperatures is not None:
+            completed_rows.append(
+                (
+                    job_id,
+                    {
+                        "filename": filename_value,
+                        "pdf_path": pdf_path_value,
+                        "temperatures": cached_temperatures,
+                    },
+                )
+            )
+            jobs.append(
+                {
+                    "job_id": job_id,
+                    "status": "success",
+                    "filename": filename_value,
+                    "pdf_path": pdf_path_value,
+                }
+            )
+            continue
         def _make_job_runner(job_id_value: str, filename_value: str, pdf_path_value: str):
             def _run():
                 try:
-                    batch_job = core.db_manager.get_job(batch_id)
-                    if batch_job and batch_job.get("status") == "canceled":
-                        core.db_manager.update_job(job_id_value, status="canceled", error_message="Batch canceled.")
+                    # Transition conditionnelle : un job deja annule en base (autre worker) n'est pas relance.
+                    # Le statut est pose par stop_upload_batch ; le raccourci local evite seulement le claim.
+                    if _is_batch_canceled(batch_id) or not core.db_manager.claim_job(job_id_value):
                         return
-                    core.db_manager.update_job(job_id_value, status="running")
-                    pdf_extractor = PDFExtractor(
-                        core.config.pdf_directory,
-                        core.config.output_directory
-                    )
+                    pdf_extractor, temp_extractor = _get_extractors()
                     pdf_result = pdf_extractor.process_single_pdf(Path(pdf_path_value))
                     if not pdf_result:
                         raise RuntimeError("Traitement PDF impossible (conversion ou detection).")
-                    temp_extractor = TemperatureExtractor(roi_config_path=core.config.roi_config_path)
                     temperatures = temp_extractor.extract_temperatures([pdf_result])
                     result = {
                         "filename": filename_value,
@@ -549,10 +1061,7 @@ async def upload_bulletins(
                     core.db_manager.update_job(job_id_value, status="error", error_message=str(exc))
             return _run
 
-        background_tasks.add_task(
-            run_in_threadpool,
-            _make_job_runner(job_id, filename_value, pdf_path_value),
-        )
+        runners.append(_make_job_runner(job_id, filename_value, pdf_path_value))
         jobs.append(
             {
                 "job_id": job_id,
@@ -562,11 +1071,13 @@ async def upload_bulletins(
             }
         )
 
-    core.db_manager.create_job(
-        batch_id,
-        "upload_batch",
-        {"job_ids": job_ids, "total": len(job_ids)},
-    )
+    # Jobs PDF + job de lot inseres en une seule transaction (les taches de fond demarrent apres la reponse).
+    job_rows.append((batch_id, "upload_batch", {"job_ids": job_ids, "total": len(job_ids)}))
+    core.db_manager.create_jobs(job_rows)
+    core.db_manager.complete_jobs(completed_rows)
+    for job_id, message in skipped_rows:
+        core.db_manager.update_job(job_id, status="skipped", error_message=message)
+    background_tasks.add_task(_submit_upload_jobs, runners, batch_id)
 
     return {
         "batch_id": batch_id,
@@ -575,7 +1086,11 @@ async def upload_bulletins(
     }
 
 
-@router.get("/upload-bulletin/jobs/{job_id}", response_model=UploadJobStatus)
+@router.get(
+    "/upload-bulletin/jobs/{job_id}",
+    response_model=None,
+    responses={200: {"model": UploadJobStatus}},
+)
 async def get_upload_job(job_id: str = ApiPath(..., min_length=1)):
     _ensure_db_ready()
     assert core.db_manager is not None
@@ -600,10 +1115,29 @@ async def get_upload_job(job_id: str = ApiPath(..., min_length=1)):
         "created_at": job.get("created_at"),
         "updated_at": job.get("updated_at"),
     }
-    return response
+    return ORJSONResponse(content=response)
 
 
-@router.get("/upload-bulletins/batches/{batch_id}", response_model=UploadBatchStatus)
+_JOB_STATUS_KEYS = ("pending", "running", "success", "error", "canceled", "skipped")
+
+
+def _batch_overall_status(counts: dict, total: int, batch_status: Optional[str]) -> str:
+    if counts["running"]:
+        return "running"
+    if counts["error"] and not counts["success"]:
+        return "error"
+    if counts["success"] + counts["skipped"] == total:
+        return "success"
+    if counts["error"]:
+        return "partial"
+    return "canceled" if batch_status == "canceled" else "pending"
+
+
+@router.get(
+    "/upload-bulletins/batches/{batch_id}",
+    response_model=None,
+    responses={200: {"model": UploadBatchStatus}},
+)
 async def get_upload_batch(batch_id: str = ApiPath(..., min_length=1)):
     _ensure_db_ready()
     assert core.db_manager is not None
@@ -618,23 +1152,13 @@ async def get_upload_batch(batch_id: str = ApiPath(..., min_length=1)):
         )
     payload = batch.get("payload") or {}
     job_ids = payload.get("job_ids") or []
-    jobs_raw = core.db_manager.get_jobs(job_ids)
-    jobs_map = {job["id"]: job for job in jobs_raw}
     jobs: List[UploadJobStatus] = []
-    counts = {"pending": 0, "running": 0, "success": 0, "error": 0, "canceled": 0}
-    for job_id in job_ids:
-        job = jobs_map.get(job_id)
-        if not job:
-            continue
+    for job in core.db_manager.get_jobs(job_ids):
         job_payload = job.get("payload") or {}
         status = job.get("status") or "pending"
-        if status in counts:
-            counts[status] += 1
-        else:
-            counts["pending"] += 1
         jobs.append(
             {
-                "job_id": job_id,
+                "job_id": job["id"],
                 "status": status,
                 "filename": job_payload.get("filename"),
                 "pdf_path": job_payload.get("pdf_path"),
@@ -645,30 +1169,26 @@ async def get_upload_batch(batch_id: str = ApiPath(..., min_length=1)):
             }
         )
 
-    overall_status = "pending"
-    batch_status = batch.get("status")
-    if batch_status == "canceled":
-        overall_status = "canceled"
-    if counts["running"] > 0:
-        overall_status = "running"
-    elif counts["error"] > 0 and counts["success"] == 0:
-        overall_status = "error"
-    elif counts["success"] == len(job_ids):
-        overall_status = "success"
-    elif counts["error"] > 0:
-        overall_status = "partial"
-
-    return {
-        "batch_id": batch_id,
-        "status": overall_status,
-        "total": len(job_ids),
-        "pending": counts["pending"],
-        "running": counts["running"],
-        "success": counts["success"],
-        "error": counts["error"],
-        "canceled": counts["canceled"],
-        "jobs": jobs,
-    }
+    # Agregation en C (Counter) ; statuts inconnus comptes comme "pending".
+    statuses = Counter(job["status"] for job in jobs)
+    counts = {key: statuses.pop(key, 0) for key in _JOB_STATUS_KEYS}
+    counts["pending"] += sum(statuses.values())
+    overall_status = _batch_overall_status(counts, len(job_ids), batch.get("status"))
+
+    return ORJSONResponse(
+        content={
+            "batch_id": batch_id,
+            "status": overall_status,
+            "total": len(job_ids),
+            "pending": counts["pending"],
+            "running": counts["running"],
+            "success": counts["success"],
+            "error": counts["error"],
+            "canceled": counts["canceled"],
+            "skipped": counts["skipped"],
+            "jobs": jobs,
+        }
+    )
 
 
 @router.post("/upload-bulletins/batches/{batch_id}/stop")
@@ -684,18 +1204,25 @@ async def stop_upload_batch(batch_id: str = ApiPath(..., min_length=1)):
                 "message": "Batch not found.",
             },
         )
+    with _CANCELED_BATCHES_LOCK:
+        _CANCELED_BATCHES.add(batch_id)
     core.db_manager.update_job(batch_id, status="canceled", error_message="Canceled by user.")
     payload = batch.get("payload") or {}
     job_ids = payload.get("job_ids") or []
-    jobs = core.db_manager.get_jobs(job_ids)
-    for job in jobs:
-        if job.get("status") == "pending":
-            core.db_manager.update_job(job.get("id"), status="canceled", error_message="Batch canceled.")
+    canceled = core.db_manager.bulk_update_jobs(
+        job_ids,
+        status="canceled",
+        error_message="Batch canceled.",
+        where_status="pending",
+    )
+    if not canceled:
+        # Plus aucun job en attente : aucun runner ne retirera l'id.
+        _forget_canceled_batch(batch_id)
     return {"batch_id": batch_id, "status": "canceled"}
 
 
 @router.get("/files/{category}/{filename}")
-async def serve_file(category: str, filename: str):
+async def serve_file(request: Request, category: str, filename: str):
     """Serve files from temp directories (maps, pdf_images)."""
     if not core.config:
         raise HTTPException(status_code=500, detail="Config not initialized")
@@ -703,15 +1230,40 @@ async def serve_file(category: str, filename: str):
     if ".." in filename or "/" in filename or "\\" in filename:
          raise HTTPException(status_code=400, detail="Invalid filename")
 
-    base_path = core.config.output_directory / "temp"
-    if category == "maps":
-        file_path = base_path / "maps" / filename
-    elif category == "pdf_images":
-        file_path = base_path / "pdf_images" / filename
-    else:
+    if category not in _SERVE_CATEGORIES:
         raise HTTPException(status_code=400, detail="Invalid category")
+    base_path = _serve_base_dir(core.config.output_directory, category)
+    file_path = os.path.normpath(os.path.join(base_path, filename))
+    if os.path.commonpath([file_path, base_path]) != base_path:
+        raise HTTPException(status_code=400, detail="Invalid filename")
 
-    if not file_path.exists():
+    try:
+        stat = os.stat(file_path)
+    except OSError:
         raise HTTPException(status_code=404, detail="File not found")
-    
-    return FileResponse(file_path)
+
+    # Validation conditionnelle : les cartes deja affichees reviennent en 304 sans relire le fichier.
+    etag = f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    headers = {"ETag": etag, "Cache-Control": _FILE_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if etag in {tag.strip() for tag in if_none_match.split(",")} or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=headers)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                since = None
+            if since is not None and int(stat.st_mtime) <= since:
+                return Response(status_code=304, headers=headers)
+
+    if core.FILES_ACCEL_REDIRECT_PREFIX:
+        # Derriere nginx : le proxy envoie le fichier (sendfile) depuis son emplacement interne.
+        headers["X-Accel-Redirect"] = f"{core.FILES_ACCEL_REDIRECT_PREFIX}/{category}/{filename}"
+        headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+        media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        return Response(headers=headers, media_type=media_type)
+
+    return _LargeChunkFileResponse(file_path, headers=headers, stat_result=stat)
@@ -1,50 +1,290 @@
-import json
+import asyncio
+import hashlib
 import logging
-import sqlite3
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 
 from backend.api_v1.models import (
     EvaluationMetrics,
     MetricsListResponse,
     MetricsRecalculateRequest
 )
+from backend.api_v1 import cache
 import backend.api_v1.core as core
 from backend.api_v1.core import _ensure_db_ready, ErrorCode
-from backend.api_v1.utils import _cache_get, _cache_set, _cache_clear
+from backend.api_v1.utils import _single_flight
+from backend.api_v1.serialization import ORJSONResponse, ORJSONRoute, dumps as json_dumps, loads as json_loads
 from backend.modules.forecast_evaluator import ForecastEvaluator
 
 logger = logging.getLogger("anam.api")
-router = APIRouter(tags=["metrics"])
+router = APIRouter(
+    tags=["metrics"],
+    default_response_class=ORJSONResponse,
+    route_class=ORJSONRoute,
+)
+
+_ONE_DAY = timedelta(days=1)
+
+@lru_cache(maxsize=1)
+def _evaluator(db_manager) -> ForecastEvaluator:
+    # Sans etat hormis db_manager : une instance par gestionnaire (une nouvelle si la base est reinitialisee).
+    return ForecastEvaluator(db_manager)
+
+
+_REFRESH_TASKS: "set[asyncio.Task]" = set()
+
+
+async def _refresh(cache_key: str, loader, *args) -> None:
+    try:
+        value = await _single_flight(cache_key, loader, *args)
+    except Exception as exc:
+        logger.warning("Rafraichissement du cache %s impossible : %s", cache_key, exc)
+        return
+    if value:
+        await cache.set_value(cache_key, value, ttl=cache.TTL_LONG, stale_ttl=cache.TTL_STALE)
+
+
+async def _cached_or_stale(cache_key: str, loader, *args) -> Any:
+    """Valeur fraiche, sinon copie perimee servie tout de suite (rafraichie en arriere-plan), sinon chargement."""
+    cached = await cache.get_value(cache_key)
+    if cached is not None:
+        return cached
+    stale = await cache.get_stale(cache_key)
+    if stale is not None:
+        task = asyncio.create_task(_refresh(cache_key, loader, *args))
+        _REFRESH_TASKS.add(task)
+        task.add_done_callback(_REFRESH_TASKS.discard)
+        return stale
+    value = await _single_flight(cache_key, loader, *args)
+    if value:
+        await cache.set_value(cache_key, value, ttl=cache.TTL_LONG, stale_ttl=cache.TTL_STALE)
+    return value
+
+
+def _load_monthly_metrics_list(limit: int) -> Optional[dict]:
+    items = core.db_manager.list_monthly_metrics(limit)  # type: ignore[union-attr]
+    logger.info(f"list_monthly_metrics: found {len(items)} items with limit={limit}")
+    return {"items": items, "total": len(items)} if items else None
+
+
+# Colonnes des metriques, dans l'ordre des SELECT ci-dessous : une ligne = dict(zip(_METRIC_COLUMNS, row)).
+_METRIC_COLUMNS = (
+    "date",
+    "forecast_reference_date",
+    "mae_tmin",
+    "mae_tmax",
+    "rmse_tmin",
+    "rmse_tmax",
+    "bias_tmin",
+    "bias_tmax",
+    "accuracy_weather",
+    "precision_weather",
+    "recall_weather",
+    "f1_score_weather",
+    "sample_size",
+    "calculated_at",
+    "confusion_matrix",
+)
+_METRICS_SELECT = """
+    SELECT bulletin_date, forecast_reference_date, mae_tmin, mae_tmax, rmse_tmin, rmse_tmax,
+           bias_tmin, bias_tmax, accuracy_weather, precision_weather, recall_weather,
+           f1_score_weather, sample_size, calculated_at, {confusion}
+    FROM evaluation_metrics
+"""
+_METRICS_DETAIL_SQL = _METRICS_SELECT.format(confusion="weather_confusion") + """
+    WHERE bulletin_date = ?
+    ORDER BY calculated_at DESC
+    LIMIT 1
+"""
+_METRICS_LIST_SQL = """
+    ORDER BY calculated_at DESC
+    LIMIT ?
+"""
+_METRICS_LIST_FULL_SQL = _METRICS_SELECT.format(confusion="weather_confusion") + _METRICS_LIST_SQL
+_METRICS_LIST_LIGHT_SQL = _METRICS_SELECT.format(confusion="NULL") + _METRICS_LIST_SQL
+
+
+def _row_to_metric(row) -> dict:
+    """Projection commune detail/liste d'une ligne positionnelle (confusion decodee si presente)."""
+    item = dict(zip(_METRIC_COLUMNS, row))
+    raw_confusion = item["confusion_matrix"]
+    item["confusion_matrix"] = json_loads(raw_confusion) if raw_confusion else None
+    return item
+
+
+def _render(model, payload: dict) -> bytes:
+    """Valide une seule fois contre le modele de reponse et serialise (pydantic-core)."""
+    return model.model_validate(payload).model_dump_json().encode("utf-8")
+
+
+def _json_body_response(request: Request, body: bytes) -> Response:
+    """Corps JSON brut (sans revalidation response_model) avec ETag ; 304 si le client a deja cette version."""
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if etag in {tag.strip() for tag in if_none_match.split(",")} or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _json_response(request: Request, payload: Any) -> Response:
+    return _json_body_response(request, json_dumps(payload).encode("utf-8"))
+
+
+def _fetch_rows(query: str, params: tuple) -> list:
+    conn = core.db_manager.get_connection()  # type: ignore[union-attr]
+    return conn.execute(query, params).fetchall()
+
+
+def _stream_metrics(query: str, limit: int, include_confusion: bool):
+    """Genere le JSON {"items": [...], "total": N} ligne par ligne, par lots lus au curseur."""
+    yield b'{"items":['
+    total = 0
+    for row in core.db_manager.iter_rows(query, (limit,)):  # type: ignore[union-attr]
+        item = dict(zip(_METRIC_COLUMNS, row))
+        del item["calculated_at"]
+        raw = item["confusion_matrix"]
+        item["confusion_matrix"] = json_loads(raw) if include_confusion and raw else None
+        yield (b"," if total else b"") + json_dumps(item).encode("utf-8")
+        total += 1
+    yield b'],"total":%d}' % total
+
+
+# Routes statiques declarees avant /metrics/{date} : sinon le parametre les capture (404).
+
+@router.get("/metrics/stations")
+async def list_stations_with_metrics(request: Request):
+    """Liste toutes les stations avec leurs métriques disponibles."""
+    db = _ensure_db_ready()
+    
+    cache_key = "stations_with_metrics"
+    cached = await cache.get_value(cache_key)
+    if cached is not None:
+        return _json_response(request, cached)
+    
+    stations = await _single_flight("stations", db.list_all_stations_with_metrics)
+    payload = {"stations": stations, "total": len(stations)}
+    
+    await cache.set_value(cache_key, payload, ttl=cache.TTL_LONG)
+    return _json_response(request, payload)
+
+
+def _compute_contingency_scores(labels, matrix):
+    # Matrice rendue carree une fois (zeros) : plus aucun acces garde ensuite, memes sommes qu'avant.
+    size = max([len(labels), len(matrix)] + [len(row) for row in matrix])
+    padded = [list(row) + [0] * (size - len(row)) for row in matrix]
+    padded += [[0] * size] * (size - len(padded))
+    mat = np.asarray(padded, dtype=np.int64).reshape(size, size)
+    total = int(mat.sum())
+    nii = np.diag(mat)[: len(labels)]
+    oi = mat.sum(axis=1)[: len(labels)]
+    pi = mat.sum(axis=0)[: len(labels)]
+    pc = (int(nii.sum()) / total) * 100 if total > 0 else None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pod = np.where(oi > 0, nii / oi, np.nan)
+        rel = np.where(pi > 0, nii / pi, np.nan)
+    rows = [
+        {
+            "code": label,
+            "pod": None if np.isnan(pod_value) else pod_value,
+            "far": None if np.isnan(rel_value) else 1 - rel_value,
+        }
+        for label, pod_value, rel_value in zip(labels, pod.tolist(), rel.tolist())
+    ]
+    return {"pc": pc, "rows": rows}
+
+
+def _compute_contingency(year: Optional[int], month: Optional[int], station_id: Optional[int]) -> dict:
+    filters = {"year": year, "month": month, "station_id": station_id}
+    observation_dates = core.db_manager.list_bulletin_dates(  # type: ignore[union-attr]
+        "observation", year=year, month=month
+    )
+    if not observation_dates:
+        # Periode sans observation (ex. mois a venir) : resultat vide sans requete ni calcul.
+        return {
+            "labels": [],
+            "matrix": [],
+            "pc": None,
+            "rows": [],
+            "sample_size": 0,
+            "days_count": 0,
+            "forecast_offset_days": 1,
+            "filters": filters,
+        }
+
+    weather_obs = []
+    weather_fore = []
+    evaluator = _evaluator(core.db_manager)
+
+    date_pairs = []
+    for observation_date in observation_dates:
+        try:
+            obs_day = date.fromisoformat(observation_date)
+        except ValueError:
+            continue
+        date_pairs.append((observation_date, (obs_day - _ONE_DAY).isoformat()))
+
+    # Une seule requete pour toute la periode au lieu d'un aller-retour SQLite par jour.
+    rows = core.db_manager.get_observation_forecast_pairs_bulk(date_pairs, station_id)  # type: ignore[union-attr]
+    days_with_pairs = len({row[0] for row in rows})
+    for row in rows:
+        weather_obs.append(row[4])
+        weather_fore.append(row[7])
+
+    metrics = evaluator.calculate_weather_metrics(weather_obs, weather_fore)
+    confusion = metrics.get("confusion_matrix") or {"labels": [], "matrix": []}
+    scores = _compute_contingency_scores(confusion.get("labels", []), confusion.get("matrix", []))
+
+    return {
+        "labels": confusion.get("labels", []),
+        "matrix": confusion.get("matrix", []),
+        "pc": scores["pc"],
+        "rows": scores["rows"],
+        "sample_size": metrics.get("sample_size", 0),
+        "days_count": days_with_pairs,
+        "forecast_offset_days": 1,
+        "filters": filters,
+    }
+
+
+@router.get("/metrics/contingency")
+async def get_contingency_metrics(
+    request: Request,
+    year: Optional[int] = Query(None, ge=1900),
+    month: Optional[int] = Query(None, ge=1, le=12),
+    station_id: Optional[int] = Query(None, ge=1),
+):
+    """Calcule la matrice de contingence depuis la base avec filtres."""
+    _ensure_db_ready()
+
+    cache_key = f"contingency:{year}:{month}:{station_id}"
+    cached = await cache.get_value(cache_key)
+    if cached is not None:
+        return _json_response(request, cached)
+
+    # Calcul complet dans le threadpool, partage entre requetes concurrentes identiques (demarrage a froid lent).
+    payload = await _single_flight(cache_key, _compute_contingency, year, month, station_id)
+    await cache.set_value(cache_key, payload, ttl=cache.TTL_NORMAL)
+    return _json_response(request, payload)
+
 
 @router.get("/metrics/{date}", response_model=EvaluationMetrics)
-async def get_evaluation_metrics(date: str):
+async def get_evaluation_metrics(date: str, request: Request):
     """Retourner les métriques d'évaluation stockées dans la base de données pour une date donnée."""
     _ensure_db_ready()
     cache_key = f"metrics:detail:{date}"
-    cached = _cache_get(cache_key)
+    cached = await cache.get_raw(cache_key)
     if cached is not None:
-        return cached
-    conn = core.db_manager.get_connection()  # type: ignore[union-attr]
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT bulletin_date, forecast_reference_date, mae_tmin, mae_tmax, rmse_tmin, rmse_tmax,
-               bias_tmin, bias_tmax, accuracy_weather, precision_weather, recall_weather,
-               f1_score_weather, weather_confusion, sample_size
-        FROM evaluation_metrics
-        WHERE bulletin_date = ?
-        ORDER BY calculated_at DESC
-        LIMIT 1
-        """,
-        (date,),
-    )
-    row = cursor.fetchone()
-    if not row:
+        return _json_body_response(request, cached)
+    rows = await _single_flight(cache_key, _fetch_rows, _METRICS_DETAIL_SQL, (date,))
+    if not rows:
         raise HTTPException(
             status_code=404,
             detail={
@@ -53,86 +293,44 @@ async def get_evaluation_metrics(date: str):
             },
         )
 
-    confusion = json.loads(row["weather_confusion"]) if row["weather_confusion"] else None
-    payload = {
-        "date": row["bulletin_date"],
-        "forecast_reference_date": row["forecast_reference_date"],
-        "mae_tmin": row["mae_tmin"],
-        "mae_tmax": row["mae_tmax"],
-        "rmse_tmin": row["rmse_tmin"],
-        "rmse_tmax": row["rmse_tmax"],
-        "bias_tmin": row["bias_tmin"],
-        "bias_tmax": row["bias_tmax"],
-        "accuracy_weather": row["accuracy_weather"],
-        "precision_weather": row["precision_weather"],
-        "recall_weather": row["recall_weather"],
-        "f1_score_weather": row["f1_score_weather"],
-        "confusion_matrix": confusion,
-        "sample_size": row["sample_size"],
-    }
-    _cache_set(cache_key, payload)
-    return payload
+    body = _render(EvaluationMetrics, _row_to_metric(rows[0]))
+    await cache.set_raw(cache_key, body, ttl=cache.TTL_NORMAL)
+    return _json_body_response(request, body)
 
 
 @router.get("/metrics", response_model=MetricsListResponse)
-async def list_evaluation_metrics(limit: int = Query(50, ge=1, le=500)):
+async def list_evaluation_metrics(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    include_confusion: bool = Query(False),
+    stream: bool = Query(False),
+):
     """List evaluation metrics stored in the database."""
     _ensure_db_ready()
-    cache_key = f"metrics:list:{limit}"
-    cached = _cache_get(cache_key)
+    query = _METRICS_LIST_FULL_SQL if include_confusion else _METRICS_LIST_LIGHT_SQL
+    if stream:
+        # Flux sans cache : memoire bornee a un lot de lignes, premiers octets envoyes sans attendre la fin.
+        return StreamingResponse(_stream_metrics(query, limit, include_confusion), media_type="application/json")
+    cache_key = f"metrics:list:{limit}:{int(include_confusion)}"
+    cached = await cache.get_raw(cache_key)
     if cached is not None:
-        return cached
-    conn = core.db_manager.get_connection()  # type: ignore[union-attr]
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT bulletin_date, forecast_reference_date, mae_tmin, mae_tmax, rmse_tmin, rmse_tmax,
-               bias_tmin, bias_tmax, accuracy_weather, precision_weather, recall_weather,
-               f1_score_weather, weather_confusion, sample_size, calculated_at
-        FROM evaluation_metrics
-        ORDER BY calculated_at DESC
-        LIMIT ?
-        """,
-        (limit,),
-    )
-    rows = cursor.fetchall()
-    items = []
-    for row in rows:
-        confusion = json.loads(row["weather_confusion"]) if row["weather_confusion"] else None
-        items.append(
-            {
-                "date": row["bulletin_date"],
-                "forecast_reference_date": row["forecast_reference_date"],
-                "mae_tmin": row["mae_tmin"],
-                "mae_tmax": row["mae_tmax"],
-                "rmse_tmin": row["rmse_tmin"],
-                "rmse_tmax": row["rmse_tmax"],
-                "bias_tmin": row["bias_tmin"],
-                "bias_tmax": row["bias_tmax"],
-                "accuracy_weather": row["accuracy_weather"],
-                "precision_weather": row["precision_weather"],
-                "recall_weather": row["recall_weather"],
-                "f1_score_weather": row["f1_score_weather"],
-                "confusion_matrix": confusion,
-                "sample_size": row["sample_size"],
-                "calculated_at": row["calculated_at"],
-            }
-        )
-    payload = {"items": items, "total": len(items)}
-    _cache_set(cache_key, payload)
-    return payload
+        return _json_body_response(request, cached)
+    # Sans matrice de confusion, la colonne JSON n'est ni lue ni decodee.
+    rows = await _single_flight(cache_key, _fetch_rows, query, (limit,))
+    items = [_row_to_metric(row) for row in rows]
+    body = _render(MetricsListResponse, {"items": items, "total": len(items)})
+    await cache.set_raw(cache_key, body, ttl=cache.TTL_SHORT)
+    return _json_body_response(request, body)
 
 
 @router.post("/metrics/recalculate")
 async def recalculate_metrics(payload: Optional[MetricsRecalculateRequest] = None):
     """Recalculate evaluation metrics for all bulletins."""
-    _ensure_db_ready()
-    assert core.db_manager is not None
+    db = _ensure_db_ready()
     force = payload.force if payload else False
 
     def run_evaluation():
-        evaluator = ForecastEvaluator(core.db_manager)
+        evaluator = _evaluator(db)
         # 1. Calculer les métriques quotidiennes (pour compatibilité)
         daily_result = evaluator.evaluate_forecasts(force_recalculate=force)
         # 2. Calculer DIRECTEMENT les métriques mensuelles à partir des données brutes
@@ -141,15 +339,15 @@ async def recalculate_metrics(payload: Optional[MetricsRecalculateRequest] = Non
         station_result = evaluator.calculate_station_monthly_metrics()
         return {"daily": daily_result, "monthly": monthly_result, "station": station_result}
 
-    result = await run_in_threadpool(run_evaluation)
+    result = await _single_flight(f"recalc:force={force}", run_evaluation)
     
     # Invalider le cache après recalcul
-    _cache_clear("metrics:")
-    _cache_clear("monthly_metrics:")
+    for prefix in ("metrics:", "monthly_metrics:", "stations_with_metrics", "station_metrics", "contingency:"):
+        await cache.clear(prefix)
     
     if not result.get("daily"):
-        observation_count = len(core.db_manager.list_bulletin_dates("observation"))
-        forecast_count = len(core.db_manager.list_bulletin_dates("forecast"))
+        observation_count = len(await run_in_threadpool(db.list_bulletin_dates, "observation"))
+        forecast_count = len(await run_in_threadpool(db.list_bulletin_dates, "forecast"))
         return {
             "status": "no_data",
             "message": "Aucune donnee observation/prevision disponible pour recalculer.",
@@ -164,17 +362,12 @@ async def recalculate_metrics(payload: Optional[MetricsRecalculateRequest] = Non
 
 
 @router.get("/metrics/monthly/{year}/{month}")
-async def get_monthly_metrics(year: int, month: int):
+async def get_monthly_metrics(year: int, month: int, request: Request):
     """Récupère les métriques agrégées pour un mois donné."""
-    _ensure_db_ready()
-    assert core.db_manager is not None
+    db = _ensure_db_ready()
     
     cache_key = f"monthly_metrics:{year}-{month:02d}"
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-    
-    metrics = core.db_manager.get_monthly_metrics(year, month)
+    metrics = await _cached_or_stale(cache_key, db.get_monthly_metrics, year, month)
     if not metrics:
         raise HTTPException(
             status_code=404,
@@ -183,30 +376,18 @@ async def get_monthly_metrics(year: int, month: int):
                 "message": f"Aucune métrique mensuelle pour {year}-{month:02d}.",
             },
         )
-    
-    _cache_set(cache_key, metrics)
-    return metrics
+    return _json_response(request, metrics)
 
 
 @router.get("/metrics-monthly")
-async def list_monthly_metrics(limit: int = Query(12, ge=1, le=60)):
+async def list_monthly_metrics(request: Request, limit: int = Query(12, ge=1, le=60)):
     """Liste les métriques mensuelles récentes."""
     logger.info(f"list_monthly_metrics called with limit={limit}")
     _ensure_db_ready()
-    assert core.db_manager is not None
     
     cache_key = f"monthly_metrics:list:{limit}"
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        logger.info(f"Returning cached result for {cache_key}")
-        return cached
-    
-    logger.info("Calling db_manager.list_monthly_metrics")
-    items = core.db_manager.list_monthly_metrics(limit)
-    logger.info(f"list_monthly_metrics: found {len(items)} items with limit={limit}")
-    payload = {"items": items, "total": len(items)}
-    
-    if len(items) == 0:
+    payload = await _cached_or_stale(cache_key, _load_monthly_metrics_list, limit)
+    if not payload:
         logger.warning("No monthly metrics found in database")
         raise HTTPException(
             status_code=404,
@@ -216,43 +397,22 @@ async def list_monthly_metrics(limit: int = Query(12, ge=1, le=60)):
             },
         )
     
-    _cache_set(cache_key, payload)
-    return payload
+    return _json_response(request, payload)
 
 
 # Station Monthly Metrics Endpoints
 
-@router.get("/metrics/stations")
-async def list_stations_with_metrics():
-    """Liste toutes les stations avec leurs métriques disponibles."""
-    _ensure_db_ready()
-    assert core.db_manager is not None
-    
-    # Désactiver temporairement le cache pour le debug
-    # cache_key = "stations_with_metrics"
-    # cached = _cache_get(cache_key)
-    # if cached is not None:
-    #     return cached
-    
-    stations = core.db_manager.list_all_stations_with_metrics()
-    payload = {"stations": stations, "total": len(stations)}
-    
-    # _cache_set(cache_key, payload)
-    return payload
-
-
 @router.get("/metrics/station/{station_id}/monthly/{year}/{month}")
-async def get_station_monthly_metrics(station_id: int, year: int, month: int):
+async def get_station_monthly_metrics(station_id: int, year: int, month: int, request: Request):
     """Récupère les métriques mensuelles pour une station donnée."""
-    _ensure_db_ready()
-    assert core.db_manager is not None
+    db = _ensure_db_ready()
     
     cache_key = f"station_metrics:{station_id}:{year}-{month:02d}"
-    cached = _cache_get(cache_key)
+    cached = await cache.get_value(cache_key)
     if cached is not None:
-        return cached
+        return _json_response(request, cached)
     
-    metrics = core.db_manager.get_station_monthly_metrics(station_id, year, month)
+    metrics = await _single_flight(cache_key, db.get_station_monthly_metrics, station_id, year, month)
     if not metrics:
         raise HTTPException(
             status_code=404,
@@ -262,22 +422,23 @@ async def get_station_monthly_metrics(station_id: int, year: int, month: int):
             },
         )
     
-    _cache_set(cache_key, metrics)
-    return metrics
+    await cache.set_value(cache_key, metrics, ttl=cache.TTL_LONG)
+    return _json_response(request, metrics)
 
 
 @router.get("/metrics/station/{station_id}/monthly")
-async def list_station_monthly_metrics(station_id: int, limit: int = Query(12, ge=1, le=60)):
+async def list_station_monthly_metrics(
+    station_id: int, request: Request, limit: int = Query(12, ge=1, le=60)
+):
     """Liste les métriques mensuelles récentes pour une station."""
-    _ensure_db_ready()
-    assert core.db_manager is not None
+    db = _ensure_db_ready()
     
     cache_key = f"station_metrics_list:{station_id}:{limit}"
-    cached = _cache_get(cache_key)
+    cached = await cache.get_value(cache_key)
     if cached is not None:
-        return cached
+        return _json_response(request, cached)
     
-    items = core.db_manager.list_station_monthly_metrics(station_id, limit)
+    items = await _single_flight(cache_key, db.list_station_monthly_metrics, station_id, limit)
     payload = {"items": items, "total": len(items)}
     
     if len(items) == 0:
@@ -289,86 +450,5 @@ async def list_station_monthly_metrics(station_id: int, limit: int = Query(12, g
             },
         )
     
-    _cache_set(cache_key, payload)
-    return payload
-
-
-def _compute_contingency_scores(labels, matrix):
-    total = sum(sum(row) for row in matrix)
-    diag = sum(matrix[i][i] if i < len(matrix[i]) else 0 for i in range(len(labels)))
-    pc = (diag / total) * 100 if total > 0 else None
-    rows = []
-    for idx, label in enumerate(labels):
-        oi = sum(matrix[idx]) if idx < len(matrix) else 0
-        pi = sum(row[idx] for row in matrix if idx < len(row))
-        nii = matrix[idx][idx] if idx < len(matrix) and idx < len(matrix[idx]) else 0
-        pod = (nii / oi) if oi > 0 else None
-        rel = (nii / pi) if pi > 0 else None
-        far = (1 - rel) if rel is not None else None
-        rows.append({"code": label, "pod": pod, "far": far})
-    return {"pc": pc, "rows": rows}
-
-
-@router.get("/metrics/contingency")
-async def get_contingency_metrics(
-    year: Optional[int] = Query(None, ge=1900),
-    month: Optional[int] = Query(None, ge=1, le=12),
-    station_id: Optional[int] = Query(None, ge=1),
-):
-    """Calcule la matrice de contingence depuis la base avec filtres."""
-    _ensure_db_ready()
-    assert core.db_manager is not None
-
-    observation_dates = core.db_manager.list_bulletin_dates("observation")
-    if year is not None:
-        observation_dates = [
-            date for date in observation_dates if date.startswith(f"{year:04d}-")
-        ]
-    if month is not None:
-        if year is not None:
-            observation_dates = [
-                date
-                for date in observation_dates
-                if date.startswith(f"{year:04d}-{month:02d}")
-            ]
-        else:
-            observation_dates = [
-                date
-                for date in observation_dates
-                if len(date) >= 7 and date[5:7] == f"{month:02d}"
-            ]
-
-    weather_obs = []
-    weather_fore = []
-    days_with_pairs = 0
-    evaluator = ForecastEvaluator(core.db_manager)
-
-    for observation_date in observation_dates:
-        try:
-            obs_dt = datetime.strptime(observation_date, "%Y-%m-%d")
-        except ValueError:
-            continue
-        forecast_date = (obs_dt - timedelta(days=1)).strftime("%Y-%m-%d")
-        pairs = core.db_manager.get_observation_forecast_pairs(
-            observation_date, forecast_date, station_id
-        )
-        if pairs:
-            days_with_pairs += 1
-        for row in pairs:
-            weather_obs.append(row[3])
-            weather_fore.append(row[6])
-
-    metrics = evaluator.calculate_weather_metrics(weather_obs, weather_fore)
-    confusion = metrics.get("confusion_matrix") or {"labels": [], "matrix": []}
-    scores = _compute_contingency_scores(confusion.get("labels", []), confusion.get("matrix", []))
-
-    return {
-        "labels": confusion.get("labels", []),
-        "matrix": confusion.get("matrix", []),
-        "pc": scores["pc"],
-        "rows": scores["rows"],
-        "sample_size": metrics.get("sample_size", 0),
-        "days_count": days_with_pairs,
-        "forecast_offset_days": 1,
-        "filters": {"year": year, "month": month, "station_id": station_id},
-    }
+    await cache.set_value(cache_key, payload, ttl=cache.TTL_LONG)
+    return _json_response(request, payload)
@@ -118,6 +118,7 @@ class UploadJobResponse(BaseModel):
     status: str
     filename: Optional[str] = None
     pdf_path: Optional[str] = None
+    duplicate_of: Optional[str] = None
 
 
 class UploadJobStatus(BaseModel):
@@ -146,6 +147,7 @@ class UploadBatchStatus(BaseModel):
     success: int
     error: int
     canceled: int
+    skipped: int = 0
     jobs: List[UploadJobStatus]
 
 class LoginRequest(BaseModel):
@@ -12,10 +12,12 @@ from backend.api_v1.models import (
     PipelineRunDetail,
     TempRetentionSettings
 )
+from backend.api_v1 import cache
 import backend.api_v1.core as core
 from backend.api_v1.core import _ensure_db_ready, _ensure_services_ready, ErrorCode, log_event
 from backend.api_v1.utils import (
     _cache_clear,
+    _run_long_job,
     _serialize_pipeline_run,
     _get_temp_retention_days,
     _set_temp_retention_days,
@@ -58,9 +60,9 @@ async def trigger_pipeline_run(request: PipelineTriggerRequest, background_tasks
     steps_template = PipelineRunner.build_steps_template()
     run_id = core.db_manager.create_pipeline_run(steps_template)
     runner = PipelineRunner(core.config, core.db_manager, run_id, options=request.dict())
-    background_tasks.add_task(run_in_threadpool, runner.run)
+    background_tasks.add_task(_run_long_job, "pipeline", runner.run)
     _cache_clear("bulletins:")
-    _cache_clear("metrics:")
+    await cache.clear("metrics:")
     return {"run_id": run_id, "status": "running"}
 
 
@@ -69,7 +71,7 @@ async def list_pipeline_runs(limit: int = 20):
     """Return the latest recorded pipeline runs."""
     _ensure_db_ready()
     assert core.db_manager is not None
-    runs = core.db_manager.list_pipeline_runs(limit)
+    runs = await run_in_threadpool(core.db_manager.list_pipeline_runs, limit)
     return {"runs": [_serialize_pipeline_run(run, include_steps=False) for run in runs]}
 
 
@@ -149,7 +151,7 @@ async def get_pipeline_run(run_id: int):
     """Return detail for a specific pipeline run."""
     _ensure_db_ready()
     assert core.db_manager is not None
-    run = core.db_manager.get_pipeline_run(run_id)
+    run = await run_in_threadpool(core.db_manager.get_pipeline_run, run_id)
     if not run:
         raise HTTPException(
             status_code=404,
@@ -170,7 +172,7 @@ async def _start_pipeline_run(options: Optional[Dict[str, Any]] = None) -> Optio
     steps_template = PipelineRunner.build_steps_template()
     run_id = core.db_manager.create_pipeline_run(steps_template)
     runner = PipelineRunner(core.config, core.db_manager, run_id, options=options or {})
-    asyncio.create_task(run_in_threadpool(runner.run))
+    asyncio.create_task(_run_long_job("pipeline", runner.run))
     return run_id
 
 
@@ -0,0 +1,63 @@
+"""Serialisation JSON partagee par l'API (orjson si disponible, sinon json)."""
+
+import json
+from typing import Any, Callable
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+
+def dumps(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def loads(raw: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendu par orjson ; repli sur le rendu standard."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(content, option=_ORJSON_OPTIONS)
+            except TypeError:
+                pass
+        return super().render(content)
+
+
+class ORJSONRequest(Request):
+    """Request dont le corps JSON est decode par orjson (erreurs compatibles json.JSONDecodeError)."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route qui decode les corps JSON entrants via ORJSONRequest."""
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            return await original_handler(ORJSONRequest(request.scope, request.receive))
+
+        return handler
@@ -1,12 +1,20 @@
+import asyncio
 import json
 import logging
+import os
 import re
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from backend.api_errors import ErrorCode
 import backend.api_v1.core as core
@@ -14,31 +22,81 @@ import backend.api_v1.core as core
 logger = logging.getLogger("anam.api")
 
 # Cache logic
-_CACHE: Dict[str, Dict[str, Any]] = {}
+# LRU borne : cles parametrees (limit, annee/mois, station) sans croissance illimitee de la memoire.
+_CACHE_MAXSIZE = 2048
+_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_CACHE_LOCK = threading.RLock()
 
 def _cache_get(key: str):
     if core.API_CACHE_TTL_SECONDS <= 0:
         return None
-    entry = _CACHE.get(key)
-    if not entry:
-        return None
-    if entry["expires_at"] <= time.time():
-        _CACHE.pop(key, None)
-        return None
-    return entry["value"]
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if not entry:
+            return None
+        if entry["expires_at"] <= time.time():
+            _CACHE.pop(key, None)
+            return None
+        _CACHE.move_to_end(key)
+        return entry["value"]
 
-def _cache_set(key: str, value: Any):
+def _cache_set(key: str, value: Any, ttl: Optional[int] = None):
     if core.API_CACHE_TTL_SECONDS <= 0:
         return
-    _CACHE[key] = {
-        "value": value,
-        "expires_at": time.time() + core.API_CACHE_TTL_SECONDS,
-    }
+    with _CACHE_LOCK:
+        _CACHE[key] = {
+            "value": value,
+            "expires_at": time.time() + (core.API_CACHE_TTL_SECONDS if ttl is None else ttl),
+        }
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
 
 def _cache_clear(prefix: str):
-    keys = [cache_key for cache_key in _CACHE.keys() if cache_key.startswith(prefix)]
-    for cache_key in keys:
-        _CACHE.pop(cache_key, None)
+    with _CACHE_LOCK:
+        keys = [cache_key for cache_key in _CACHE.keys() if cache_key.startswith(prefix)]
+        for cache_key in keys:
+            _CACHE.pop(cache_key, None)
+
+def _cache_delete(*keys: str):
+    with _CACHE_LOCK:
+        for cache_key in keys:
+            _CACHE.pop(cache_key, None)
+
+# Calculs couteux en cours, par cle : les appels concurrents identiques attendent le meme resultat.
+_inflight: Dict[str, asyncio.Future] = {}
+
+async def _single_flight(key: str, func, *args) -> Any:
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(run_in_threadpool(func, *args))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield : un client qui se deconnecte n'annule pas le calcul partage.
+    return await asyncio.shield(future)
+
+# Travaux longs (pipeline, re-extraction, traduction) : executeurs dedies, sans occuper les jetons anyio des requetes.
+_LONG_JOB_POOLS: Dict[str, ThreadPoolExecutor] = {}
+_LONG_JOB_POOLS_LOCK = threading.Lock()
+
+def _long_job_pool(name: str, max_workers: int) -> ThreadPoolExecutor:
+    with _LONG_JOB_POOLS_LOCK:
+        pool = _LONG_JOB_POOLS.get(name)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"long-{name}")
+            _LONG_JOB_POOLS[name] = pool
+        return pool
+
+async def _run_long_job(name: str, func, *args, max_workers: int = 1, **kwargs) -> Any:
+    pool = _long_job_pool(name, max_workers)
+    return await asyncio.get_running_loop().run_in_executor(pool, partial(func, *args, **kwargs))
+
+def shutdown_long_job_pools() -> None:
+    with _LONG_JOB_POOLS_LOCK:
+        pools = list(_LONG_JOB_POOLS.values())
+        _LONG_JOB_POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 # File and Data Helpers
 def _load_result_file():
@@ -63,11 +121,28 @@ def _load_result_file():
             },
         )
 
-def _sanitize_filename(original: str) -> str:
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w-]+")
+
+
+@lru_cache(maxsize=4096)
+def _safe_filename_stem(original: str) -> str:
     base = Path(original).stem or "bulletin"
-    safe = re.sub(r"[^\w-]+", "_", base).strip("_") or "bulletin"
-    timestamp = int(time.time())
-    return f"{safe}_{timestamp}.pdf"
+    return _UNSAFE_FILENAME_RE.sub("_", base).strip("_") or "bulletin"
+
+
+def _sanitize_filename(original: str) -> str:
+    # Seul l'horodatage varie : la partie nettoyee est memoisee.
+    return f"{_safe_filename_stem(original)}_{int(time.time())}.pdf"
+
+def _uuid7() -> str:
+    """UUID version 7 (RFC 9562) : prefixe horodate en ms, donc ids croissants pour l'index B-tree."""
+    uuid7 = getattr(uuid, "uuid7", None)
+    if uuid7 is not None:
+        return str(uuid7())
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return str(uuid.UUID(int=value))
 
 def _resolve_scrape_output_dir(output_dir: Optional[str]) -> Path:
     base_dir = core.config.project_root.parent if core.config else Path.cwd()
@@ -4,7 +4,7 @@
 """Evaluation des previsions meteo pour le systeme ANAM-METEO-EVAL."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import Dict
 
 import numpy as np
@@ -20,6 +20,8 @@ from sklearn.metrics import (
 
 logger = logging.getLogger(__name__)
 
+_ONE_DAY = timedelta(days=1)
+
 
 class ForecastEvaluator:
     """Calcule les metriques servant a juger la qualite des bulletins."""
@@ -109,12 +111,12 @@ class ForecastEvaluator:
         evaluations = []
         for observation_date in observation_dates:
             try:
-                obs_dt = datetime.strptime(observation_date, "%Y-%m-%d")
+                obs_day = date.fromisoformat(observation_date)
             except ValueError:
                 logger.error("Format de date invalide pour %s", observation_date)
                 continue
 
-            forecast_reference_date = (obs_dt - timedelta(days=1)).strftime("%Y-%m-%d")
+            forecast_reference_date = (obs_day - _ONE_DAY).isoformat()
             candidates = []
             if forecast_reference_date in forecast_dates:
                 candidates.append(forecast_reference_date)
@@ -209,6 +211,7 @@ class ForecastEvaluator:
         months = cursor.fetchall()
         
         calculated_count = 0
+        monthly_rows = []
         
         for year_str, month_str in months:
             year = int(year_str)
@@ -287,11 +290,13 @@ class ForecastEvaluator:
                 (f"{year_str}-{month_str}",)
             )))
             
-            # Sauvegarder
-            self.db_manager.save_monthly_metrics(year, month, all_metrics)
+            monthly_rows.append((year, month, all_metrics))
             calculated_count += 1
             logger.info(f"Métriques mensuelles calculées pour {year}-{month:02d} : {all_metrics['days_evaluated']} jours, {all_metrics['sample_size']} échantillons")
         
+        # Sauvegarder tous les mois en une seule transaction
+        self.db_manager.bulk_save_monthly_metrics(monthly_rows)
+        
         return {
             "status": "done",
             "months_calculated": calculated_count,
@@ -314,6 +319,7 @@ class ForecastEvaluator:
         months = cursor.fetchall()
         
         aggregated_count = 0
+        monthly_rows = []
         for year_str, month_str in months:
             year = int(year_str)
             month = int(month_str)
@@ -358,10 +364,12 @@ class ForecastEvaluator:
                     "days_evaluated": row[11] or 0,
                 }
                 
-                self.db_manager.save_monthly_metrics(year, month, monthly_metrics)
+                monthly_rows.append((year, month, monthly_metrics))
                 aggregated_count += 1
                 logger.info(f"Métriques mensuelles agrégées pour {year}-{month:02d} : {row[11]} jours")
         
+        self.db_manager.bulk_save_monthly_metrics(monthly_rows)
+        
         return {
             "status": "done",
             "months_aggregated": aggregated_count,
@@ -377,6 +385,7 @@ class ForecastEvaluator:
         stations = cursor.fetchall()
         
         calculated_count = 0
+        station_rows = []
         
         for station_id, station_name in stations:
             # Récupérer tous les mois ayant des observations pour cette station
@@ -474,8 +483,7 @@ class ForecastEvaluator:
                     (station_id, f"{year_str}-{month_str}"),
                 )))
                 
-                # Sauvegarder
-                self.db_manager.save_station_monthly_metrics(station_id, year, month, all_metrics)
+                station_rows.append((station_id, year, month, all_metrics))
                 station_calculated += 1
                 logger.info(f"Métriques mensuelles calculées pour {station_name} - {year}-{month:02d} : {all_metrics['days_evaluated']} jours, {all_metrics['sample_size']} échantillons")
             
@@ -483,6 +491,9 @@ class ForecastEvaluator:
                 calculated_count += 1
                 logger.info(f"Station {station_name}: {station_calculated} mois calculés")
         
+        # Sauvegarder toutes les stations/mois en une seule transaction
+        self.db_manager.bulk_save_station_monthly_metrics(station_rows)
+        
         return {
             "status": "done",
             "stations_processed": calculated_count,
@@ -194,38 +194,47 @@ class MeteoBurkinaScraper:
                     continue
         return max(page_numbers) if page_numbers else 1
 
-    def get_bulletin_list(self, use_pagination=True, max_pages=None, year=None, month=None, day=None):
-        """Retourne la liste des bulletins (avec pagination et filtres eventuels)."""
-        print(f"Recuperation de la liste des bulletins depuis {self.bulletins_url}")
-
-        bulletins = []
+    def iter_bulletins(self, year=None, month=None, day=None, max_pages=None, use_pagination=True):
+        """Produit les bulletins page par page (filtres appliques), sans charger les pages suivantes d'avance."""
         page_number = 1
         total_pages = None
 
         while True:
             soup = self._fetch_page(page_number)
             if soup is None:
-                break
+                return
 
             page_bulletins = self._parse_bulletins_from_soup(soup)
             if not page_bulletins and page_number == 1:
                 print(" - Aucun bulletin trouve sur la page initiale.")
-                break
+                return
 
-            bulletins.extend(page_bulletins)
+            yield from self._filter_bulletins_by_date(page_bulletins, year=year, month=month, day=day)
 
             if not use_pagination:
-                break
+                return
 
             if total_pages is None:
                 total_pages = self._extract_total_pages(soup)
 
             if (max_pages and page_number >= max_pages) or page_number >= total_pages:
-                break
+                return
 
             page_number += 1
 
-        bulletins = self._filter_bulletins_by_date(bulletins, year=year, month=month, day=day)
+    def get_bulletin_list(self, use_pagination=True, max_pages=None, year=None, month=None, day=None):
+        """Retourne la liste des bulletins (avec pagination et filtres eventuels)."""
+        print(f"Recuperation de la liste des bulletins depuis {self.bulletins_url}")
+
+        bulletins = list(
+            self.iter_bulletins(
+                year=year,
+                month=month,
+                day=day,
+                max_pages=max_pages,
+                use_pagination=use_pagination,
+            )
+        )
 
         print(f" -> {len(bulletins)} bulletins trouves apres filtrage")
         return bulletins
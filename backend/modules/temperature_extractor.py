@@ -37,6 +37,7 @@ class TemperatureExtractor:
         self.roi_base_height = int(os.getenv("ROI_BASE_HEIGHT", "0"))
         self.color_mask_upscale = float(os.getenv("TEMPERATURE_COLOR_MASK_UPSCALE", "3.0"))
         self._roi_lookup = self._build_roi_lookup()
+        self._scaled_roi_cache = {}
         timeout_value = float(os.getenv("TEMPERATURE_OCR_TIMEOUT_SECONDS", "0"))
         self.ocr_timeout = timeout_value if timeout_value > 0 else None
         self.ocr_workers = max(1, int(os.getenv("TEMPERATURE_OCR_WORKERS", "1")))
@@ -442,44 +443,57 @@ class TemperatureExtractor:
 
     def extract_temperatures(self, pdf_results):
         """Applique l'extraction a chaque carte referencee par le PDF extractor."""
-        def _process_pdf(pdf_result):
-            pdf_temps_data = {
-                "pdf_path": pdf_result["pdf_path"],
-                "image_path": pdf_result.get("image_path"),
-                "data": [],
-            }
-
+        # Unite de travail = une carte (et non un PDF) : les cartes d'un meme bulletin s'executent en parallele.
+        tasks = []
+        for pdf_index, pdf_result in enumerate(pdf_results):
             for map_data in pdf_result.get("maps", []):
                 map_image_path = map_data.get("image_path") or pdf_result["image_path"]
                 map_bbox = map_data.get("bbox")
                 if map_image_path != pdf_result.get("image_path"):
                     map_bbox = None
+                tasks.append((pdf_index, map_data["type"], map_image_path, map_bbox))
 
-                temps = self.extract_temperature_values(
-                    map_image_path,
-                    map_bbox,
-                )
-                pdf_temps_data["data"].append(
-                    {
-                        "type": map_data["type"],
-                        "image_path": map_image_path,
-                        "temperatures": temps,
-                    }
-                )
-
-            return pdf_temps_data
+        def _process_map(task):
+            _, _, map_image_path, map_bbox = task
+            return self.extract_temperature_values(map_image_path, map_bbox)
 
-        if self.ocr_workers <= 1 or len(pdf_results) <= 1:
-            return [_process_pdf(pdf) for pdf in pdf_results]
+        if self.ocr_workers <= 1 or len(tasks) <= 1:
+            temps_per_map = [_process_map(task) for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.ocr_workers, len(tasks))) as executor:
+                temps_per_map = list(executor.map(_process_map, tasks))
 
-        with ThreadPoolExecutor(max_workers=min(self.ocr_workers, len(pdf_results))) as executor:
-            return list(executor.map(_process_pdf, pdf_results))
+        results = [
+            {
+                "pdf_path": pdf_result["pdf_path"],
+                "image_path": pdf_result.get("image_path"),
+                "data": [],
+            }
+            for pdf_result in pdf_results
+        ]
+        for (pdf_index, map_type, map_image_path, _), temps in zip(tasks, temps_per_map):
+            results[pdf_index]["data"].append(
+                {
+                    "type": map_type,
+                    "image_path": map_image_path,
+                    "temperatures": temps,
+                }
+            )
+        return results
 
     def _log_verbose(self, message: str) -> None:
         if self.verbose:
             logger.warning(message)
 
     def _get_scaled_roi_lookup(self, image_shape):
+        # Les cartes d'un meme lot partagent la resolution : ROI mises a l'echelle une fois par taille.
+        shape_key = tuple(image_shape[:2])
+        cached = self._scaled_roi_cache.get(shape_key)
+        if cached is None:
+            cached = self._scaled_roi_cache[shape_key] = self._compute_scaled_roi_lookup(image_shape)
+        return cached
+
+    def _compute_scaled_roi_lookup(self, image_shape):
         scale_x, scale_y = get_scale_factors(self.roi_config, image_shape)
         if abs(scale_x - 1.0) < 1e-3 and abs(scale_y - 1.0) < 1e-3:
             return self._roi_lookup
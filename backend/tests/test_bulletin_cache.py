@@ -0,0 +1,17 @@
+from backend.api_v1.bulletins import _invalidate_bulletin_date_cache
+from backend.api_v1.utils import _cache_clear, _cache_get, _cache_set
+
+
+def test_translation_invalidates_next_day_detail():
+    _cache_clear("")
+    for day in ("2024-01-01", "2024-01-02", "2024-01-03"):
+        for suffix in ("all", "forecast"):
+            _cache_set(f"bulletins:detail:{day}:{suffix}", {"date_bulletin": day})
+
+    _invalidate_bulletin_date_cache("2024-01-01")
+
+    # J+1 affiche les previsions de J : son detail ne doit pas garder l'ancienne traduction.
+    assert _cache_get("bulletins:detail:2024-01-01:all") is None
+    assert _cache_get("bulletins:detail:2024-01-02:forecast") is None
+    assert _cache_get("bulletins:detail:2024-01-03:all") == {"date_bulletin": "2024-01-03"}
+    _cache_clear("")
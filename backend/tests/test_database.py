@@ -94,3 +94,148 @@ def test_thread_local_connections(tmp_path):
     assert connection_ids[0] != connection_ids[1]
 
     manager.close()
+
+
+def test_bulk_bulletin_ingest_helpers(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+
+    existing_path = str(tmp_path / "existing.pdf")
+    manager.insert_bulletin("2024-01-01", "observation", existing_path, "Existing")
+    new_path = str(tmp_path / "new.pdf")
+
+    assert manager.bulk_has_bulletins([existing_path, new_path]) == {existing_path}
+
+    inserted = manager.bulk_insert_bulletins([("2024-01-02", "forecast", new_path, "New")])
+    assert inserted == 1
+    assert manager.has_bulletin_for_pdf(new_path)
+
+    updated = manager.bulk_upsert_bulletin_payloads(
+        [(new_path, {"stations": [{"name": "Bobo"}]}), (new_path, {"stations": []})]
+    )
+    assert updated == 2
+    assert manager.get_bulletin_payload_by_path(new_path) == {"stations": []}
+
+    manager.close()
+
+
+def test_create_jobs_batch(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+
+    created = manager.create_jobs(
+        [
+            ("job-1", "upload_bulletin", {"filename": "a.pdf"}),
+            ("batch-1", "upload_batch", {"job_ids": ["job-1"], "total": 1}),
+        ]
+    )
+    assert created == 2
+    assert [job["id"] for job in manager.get_jobs(["batch-1", "missing", "job-1"])] == ["batch-1", "job-1"]
+    jobs = {job["id"]: job for job in manager.get_jobs(["job-1", "batch-1"])}
+    assert jobs["job-1"]["status"] == "pending"
+    assert jobs["batch-1"]["payload"]["total"] == 1
+
+    manager.create_jobs([("job-2", "upload_bulletin", {"filename": "b.pdf"}, "abc123")])
+    assert manager.get_job_results_by_sha1(["abc123"]) == {}
+    manager.complete_jobs([("job-2", {"temperatures": [1]})])
+    assert manager.get_job_results_by_sha1(["abc123", "missing"]) == {"abc123": {"temperatures": [1]}}
+
+    manager.close()
+
+
+def test_claim_job_skips_canceled(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    manager.create_jobs([("job-1", "upload_bulletin", {}), ("job-2", "upload_bulletin", {})])
+    manager.update_job("job-2", status="canceled")
+
+    assert manager.claim_job("job-1") is True
+    assert manager.claim_job("job-1") is False
+    assert manager.claim_job("job-2") is False
+    assert manager.get_job("job-2")["status"] == "canceled"
+
+    manager.create_jobs([("job-3", "upload_bulletin", {})])
+    updated = manager.bulk_update_jobs(
+        ["job-1", "job-3"], status="canceled", error_message="Batch canceled.", where_status="pending"
+    )
+    assert updated == 1
+    assert manager.get_job("job-1")["status"] == "running"
+    assert manager.get_job("job-3")["error_message"] == "Batch canceled."
+
+    manager.close()
+
+
+def test_observation_forecast_pairs_bulk_matches_single(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    bobo = manager.insert_station("Bobo", 11.1, -4.3)
+    ouaga = manager.insert_station("Ouaga", 12.4, -1.5)
+    for day, condition in (("2024-01-01", "sunny"), ("2024-01-02", "rain"), ("2024-01-03", "cloudy")):
+        for kind in ("observation", "forecast"):
+            bulletin_id = manager.insert_bulletin(day, kind)
+            manager.insert_weather_data(bulletin_id, bobo, 20, 35, condition)
+            manager.insert_weather_data(bulletin_id, ouaga, 21, 36, condition)
+
+    date_pairs = [("2024-01-02", "2024-01-01"), ("2024-01-03", "2024-01-02"), ("2024-01-04", "2024-01-03")]
+    rows = manager.get_observation_forecast_pairs_bulk(date_pairs)
+    expected = [
+        (obs_date, *tuple(row))
+        for obs_date, fore_date in date_pairs
+        for row in manager.get_observation_forecast_pairs(obs_date, fore_date)
+    ]
+    assert sorted(tuple(row) for row in rows) == sorted(expected)
+    assert len(rows) == 4
+
+    filtered = manager.get_observation_forecast_pairs_bulk(date_pairs, station_id=ouaga)
+    assert {row[1] for row in filtered} == {"Ouaga"}
+    assert manager.get_observation_forecast_pairs_bulk([]) == []
+
+    manager.close()
+
+
+def test_list_bulletin_dates_filters(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    for day in ("2023-12-31", "2024-01-05", "2024-01-05", "2024-02-01", "2024-12-15", "2025-01-02"):
+        manager.insert_bulletin(day, "observation")
+    manager.insert_bulletin("2024-01-06", "forecast")
+
+    assert manager.list_bulletin_dates("observation") == [
+        "2023-12-31", "2024-01-05", "2024-02-01", "2024-12-15", "2025-01-02"
+    ]
+    assert manager.list_bulletin_dates("observation", year=2024) == ["2024-01-05", "2024-02-01", "2024-12-15"]
+    assert manager.list_bulletin_dates("observation", year=2024, month=12) == ["2024-12-15"]
+    assert manager.list_bulletin_dates("observation", month=1) == ["2024-01-05", "2025-01-02"]
+
+    manager.close()
+
+
+def test_wal_connection_and_iter_rows(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    manager.insert_bulletin("2024-01-01", "observation")
+
+    assert manager.get_connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert list(manager.iter_rows("SELECT date FROM bulletins", batch_size=1)) == [("2024-01-01",)]
+
+    manager.close()
+
+
+def test_bulk_save_monthly_metrics_upserts(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    station_id = manager.insert_station("Bobo", 11.1, -4.3)
+
+    saved = manager.bulk_save_monthly_metrics(
+        [(2024, 1, {"mae_tmin": 1.0, "sample_size": 10}), (2024, 2, {"mae_tmin": 2.0, "sample_size": 20})]
+    )
+    assert saved == 2
+    manager.save_monthly_metrics(2024, 1, {"mae_tmin": 1.5, "sample_size": 12})
+    assert [(item["month"], item["mae_tmin"]) for item in manager.list_monthly_metrics()] == [(2, 2.0), (1, 1.5)]
+    assert manager.get_monthly_metrics(2024, 1)["sample_size"] == 12
+
+    manager.bulk_save_station_monthly_metrics([(station_id, 2024, 1, {"mae_tmax": 0.5, "days_evaluated": 3})])
+    assert manager.get_station_monthly_metrics(station_id, 2024, 1)["mae_tmax"] == 0.5
+    assert manager.bulk_save_monthly_metrics([]) == 0
+
+    manager.close()
@@ -0,0 +1,100 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import backend.api_v1.core as core
+from backend.api_v1.metrics import router
+from backend.api_v1.utils import _cache_clear
+from backend.utils.database import DatabaseManager
+
+
+def _client(monkeypatch, tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    monkeypatch.setattr(core, "db_manager", manager)
+    monkeypatch.setattr(core, "READY", True)
+    _cache_clear("")
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app), manager
+
+
+def _seed_pairs(manager):
+    bobo = manager.insert_station("Bobo", 11.1, -4.3)
+    ouaga = manager.insert_station("Ouaga", 12.4, -1.5)
+    for day, condition in (("2024-01-01", "sunny"), ("2024-01-02", "rain"), ("2024-01-03", "sunny")):
+        for kind in ("observation", "forecast"):
+            bulletin_id = manager.insert_bulletin(day, kind)
+            manager.insert_weather_data(bulletin_id, bobo, 20, 35, condition)
+            manager.insert_weather_data(bulletin_id, ouaga, 21, 36, condition)
+    return bobo, ouaga
+
+
+def test_contingency_route_is_not_captured_by_date(monkeypatch, tmp_path):
+    client, manager = _client(monkeypatch, tmp_path)
+    _seed_pairs(manager)
+
+    response = client.get("/metrics/contingency", params={"year": 2024, "month": 1})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["filters"] == {"year": 2024, "month": 1, "station_id": None}
+    assert body["sample_size"] == 4
+    assert body["days_count"] == 2
+    assert body["labels"]
+    assert body["pc"] is not None
+    manager.close()
+
+
+def test_stations_route_is_cached_until_recalculation(monkeypatch, tmp_path):
+    client, manager = _client(monkeypatch, tmp_path)
+    bobo, _ouaga = _seed_pairs(manager)
+
+    first = client.get("/metrics/stations")
+    assert first.status_code == 200
+    assert first.json() == {"stations": [], "total": 0}
+
+    # Calcul hors API : la liste en cache reste servie jusqu'au recalcul.
+    manager.save_station_monthly_metrics(bobo, 2024, 1, {"mae_tmin": 0.0})
+    assert client.get("/metrics/stations").json()["total"] == 0
+
+    assert client.post("/metrics/recalculate").status_code == 200
+    assert client.get("/metrics/stations").json()["total"] == 2
+    manager.close()
+
+
+def test_stations_route_groups_metrics_per_station(monkeypatch, tmp_path):
+    client, manager = _client(monkeypatch, tmp_path)
+    bobo, ouaga = _seed_pairs(manager)
+    manager.bulk_save_station_monthly_metrics(
+        [(bobo, 2024, 1, {"mae_tmin": 1.0}), (bobo, 2024, 2, {"mae_tmin": 2.0}), (ouaga, 2024, 1, {"mae_tmin": 0.5})]
+    )
+
+    body = client.get("/metrics/stations").json()
+
+    assert body["total"] == 2
+    assert [(item["id"], item["name"], item["metrics_count"]) for item in body["stations"]] == [
+        (bobo, "Bobo", 2),
+        (ouaga, "Ouaga", 1),
+    ]
+    assert all(item["last_calculated"] for item in body["stations"])
+    manager.close()
+
+
+def test_contingency_without_matching_observations_is_empty(monkeypatch, tmp_path):
+    client, manager = _client(monkeypatch, tmp_path)
+    _seed_pairs(manager)
+
+    response = client.get("/metrics/contingency", params={"year": 2030, "month": 6})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "labels": [],
+        "matrix": [],
+        "pc": None,
+        "rows": [],
+        "sample_size": 0,
+        "days_count": 0,
+        "forecast_offset_days": 1,
+        "filters": {"year": 2030, "month": 6, "station_id": None},
+    }
+    manager.close()
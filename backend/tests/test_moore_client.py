@@ -0,0 +1,25 @@
+import asyncio
+from types import SimpleNamespace
+
+from backend.api_v1 import bulletins
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def post(self, url, json, timeout):
+        self.calls.append(json["text"])
+        return SimpleNamespace(status_code=200, json=lambda: {"translation": f"mos:{json['text']}"})
+
+
+def test_async_and_background_paths_share_one_client(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(bulletins, "_MOORE_SESSION", session)
+
+    background = bulletins._translate_moore_external("Ciel clair")
+    endpoint = asyncio.run(bulletins._translate_moore_external_async("Pluie"))
+
+    # Meme session (donc meme politique de retry) et meme semaphore pour les deux chemins.
+    assert (background, endpoint) == ("mos:Ciel clair", "mos:Pluie")
+    assert session.calls == ["Ciel clair", "Pluie"]
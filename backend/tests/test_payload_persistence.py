@@ -61,3 +61,31 @@ def test_payload_and_snapshot_persistence(tmp_path):
     assert prevision["tmax"] == 36.0
 
     manager.close()
+
+
+def test_apply_translation_result_writes_all_tables(tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    manager.insert_bulletin("2024-01-15", "forecast", "sample.pdf", "Bulletin")
+
+    station = {"name": "Ouaga", "type": "forecast", "tmin": 20.0}
+    payload = {"pdf_path": "sample.pdf", "stations": [station], "interpretation_moore": "Moore"}
+    updated = manager.apply_translation_result(
+        "2024-01-15",
+        "forecast",
+        {"fr": "Texte FR", "moore": "Moore"},
+        "sample.pdf",
+        station_snapshot=station,
+        payload_entry=payload,
+    )
+    assert updated == 1
+
+    cursor = manager.get_connection().cursor()
+    cursor.execute("SELECT interpretation_francais, interpretation_moore FROM bulletins")
+    assert cursor.fetchone() == ("Texte FR", "Moore")
+    cursor.execute("SELECT station_name FROM station_snapshots WHERE pdf_path = ?", ("sample.pdf",))
+    assert cursor.fetchone()[0] == "Ouaga"
+    stored = manager.get_bulletin_payload_by_path("sample.pdf")
+    assert stored["interpretation_moore"] == "Moore"
+
+    manager.close()
@@ -0,0 +1,52 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import backend.api_v1.core as core
+from backend.api_errors import ErrorCode
+from backend.api_v1.data_management import router
+
+
+def _client(monkeypatch, max_bytes=1024):
+    monkeypatch.setattr(core, "READY", True)
+    monkeypatch.setattr(core, "UPLOAD_MAX_PDF_BYTES", max_bytes)
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_upload_empty_file_is_rejected(monkeypatch):
+    client = _client(monkeypatch)
+
+    response = client.post("/upload-bulletin", files={"file": ("vide.pdf", b"", "application/pdf")})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == ErrorCode.UPLOAD_EMPTY.value
+
+
+def test_upload_oversized_file_is_rejected(monkeypatch):
+    client = _client(monkeypatch)
+
+    response = client.post("/upload-bulletin", files={"file": ("gros.pdf", b"%PDF" + b"0" * 2048, "application/pdf")})
+
+    assert response.status_code == 413
+    assert response.json()["detail"]["code"] == ErrorCode.UPLOAD_INVALID.value
+
+
+def test_upload_oversized_chunked_file_is_rejected(monkeypatch):
+    client = _client(monkeypatch)
+    boundary = "anam-boundary"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="gros.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode() + b"%PDF" + b"0" * 2048 + f"\r\n--{boundary}--\r\n".encode()
+
+    # Corps envoye en chunked : pas d'en-tete Content-Length, la limite est appliquee sur le spool.
+    response = client.post(
+        "/upload-bulletin",
+        content=iter([body]),
+        headers={"content-type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["detail"]["code"] == ErrorCode.UPLOAD_INVALID.value
@@ -0,0 +1,111 @@
+import hashlib
+import time
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import backend.api_v1.core as core
+from backend.api_v1 import data_management
+from backend.api_v1.data_management import _extraction_fingerprint, router
+from backend.utils.database import DatabaseManager
+
+PDF_A = b"%PDF-1.4 bulletin A"
+PDF_B = b"%PDF-1.4 bulletin B"
+
+
+def _client(monkeypatch, tmp_path):
+    manager = DatabaseManager(tmp_path / "meteo.db")
+    manager.initialize_database()
+    pdf_dir = tmp_path / "pdfs"
+    pdf_dir.mkdir()
+    monkeypatch.setattr(core, "db_manager", manager)
+    monkeypatch.setattr(core, "config", SimpleNamespace(pdf_directory=pdf_dir, roi_config_path=None))
+    monkeypatch.setattr(core, "READY", True)
+    _extraction_fingerprint.cache_clear()
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app), manager
+
+
+def _seed_result(manager, content: bytes, fingerprint: str, job_id: str) -> None:
+    sha1 = hashlib.sha1(content).hexdigest()
+    manager.create_jobs([(job_id, "upload_bulletin", {"extractor_fingerprint": fingerprint}, sha1)])
+    manager.complete_jobs([(job_id, {"filename": f"{job_id}.pdf", "pdf_path": "", "temperatures": [job_id]})])
+
+
+def test_batch_reports_duplicates_and_reuses_matching_fingerprint(monkeypatch, tmp_path):
+    client, manager = _client(monkeypatch, tmp_path)
+    _seed_result(manager, PDF_A, _extraction_fingerprint(), "old-a")
+    _seed_result(manager, PDF_B, "autre-config", "old-b")
+    submitted = []
+    monkeypatch.setattr(data_management, "_submit_upload_jobs", lambda runners, batch_id=None: submitted.extend(runners))
+
+    response = client.post(
+        "/upload-bulletins",
+        files=[
+            ("files", ("a.pdf", PDF_A, "application/pdf")),
+            ("files", ("a-copie.pdf", PDF_A, "application/pdf")),
+            ("files", ("b.pdf", PDF_B, "application/pdf")),
+        ],
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 3
+    first, duplicate, other = body["jobs"]
+    assert first["status"] == "success"
+    assert duplicate["status"] == "skipped"
+    assert duplicate["duplicate_of"] == first["job_id"]
+    # Resultat produit avec une autre config d'extraction : PDF retraite.
+    assert other["status"] == "pending"
+    assert len(submitted) == 1
+
+    batch = client.get(f"/upload-bulletins/batches/{body['batch_id']}").json()
+    assert (batch["total"], batch["success"], batch["skipped"], batch["pending"]) == (3, 1, 1, 1)
+    skipped_job = next(job for job in batch["jobs"] if job["status"] == "skipped")
+    assert "a.pdf" in skipped_job["error_message"]
+    manager.close()
+
+
+def test_force_bypasses_stored_results(monkeypatch, tmp_path):
+    client, manager = _client(monkeypatch, tmp_path)
+    _seed_result(manager, PDF_A, _extraction_fingerprint(), "old-a")
+    submitted = []
+    monkeypatch.setattr(data_management, "_submit_upload_jobs", lambda runners, batch_id=None: submitted.extend(runners))
+
+    response = client.post(
+        "/upload-bulletins",
+        params={"force": "true"},
+        files=[("files", ("a.pdf", PDF_A, "application/pdf"))],
+    )
+
+    assert [job["status"] for job in response.json()["jobs"]] == ["pending"]
+    assert len(submitted) == 1
+    manager.close()
+
+
+def test_stopped_batch_is_forgotten_once_its_runners_finish(monkeypatch, tmp_path):
+    client, manager = _client(monkeypatch, tmp_path)
+    submit_upload_jobs = data_management._submit_upload_jobs
+    submitted = []
+    monkeypatch.setattr(data_management, "_submit_upload_jobs", lambda runners, batch_id=None: submitted.append((runners, batch_id)))
+
+    def _no_extraction():
+        raise AssertionError("extraction lancee pour un lot annule")
+
+    monkeypatch.setattr(data_management, "_get_extractors", _no_extraction)
+    body = client.post("/upload-bulletins", files=[("files", ("a.pdf", PDF_A, "application/pdf"))]).json()
+    batch_id = body["batch_id"]
+    assert client.post(f"/upload-bulletins/batches/{batch_id}/stop").status_code == 200
+    assert data_management._is_batch_canceled(batch_id)
+
+    # Le runner voit le lot annule sans claim ni extraction, puis l'id est oublie.
+    submit_upload_jobs(*submitted[0])
+    deadline = time.monotonic() + 5
+    while data_management._is_batch_canceled(batch_id) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not data_management._is_batch_canceled(batch_id)
+    assert manager.get_job(body["jobs"][0]["job_id"])["status"] == "canceled"
+    manager.close()
@@ -37,6 +37,18 @@ class BackgroundTask:
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _iso_cache: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def isoformat(self, name: str) -> Optional[str]:
+        """Retourne le timestamp `name` au format ISO, memorise tant qu'il ne change pas."""
+        value = getattr(self, name)
+        if value is None:
+            return None
+        cached = self._iso_cache.get(name)
+        if cached is None or cached[0] is not value:
+            cached = (value, value.isoformat())
+            self._iso_cache[name] = cached
+        return cached[1]
 
 
 class BackgroundTaskManager:
@@ -12,7 +12,55 @@ import json
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialise les payloads volumineux (orjson si disponible, sinon json)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _json_loads(raw: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_STATEMENT_CACHE_SIZE = 256
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+)
+# Colonnes communes a monthly_metrics et station_monthly_metrics, dans l'ordre des INSERT.
+_MONTHLY_METRIC_FIELDS = (
+    "mae_tmin",
+    "mae_tmax",
+    "rmse_tmin",
+    "rmse_tmax",
+    "bias_tmin",
+    "bias_tmax",
+    "accuracy_weather",
+    "precision_weather",
+    "recall_weather",
+    "f1_score_weather",
+    "sample_size",
+    "days_evaluated",
+)
+
 
 class DatabaseManager:
     """Manages database operations for meteorological data"""
@@ -22,15 +70,39 @@ class DatabaseManager:
         self._local = threading.local()
         self._connections: List[sqlite3.Connection] = []
     
+    def _open_connection(self) -> sqlite3.Connection:
+        # Cache de requetes preparees + WAL/mmap : lectures concurrentes sans bloquer l'ecrivain.
+        conn = sqlite3.connect(self.db_path, cached_statements=_STATEMENT_CACHE_SIZE)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        self._connections.append(conn)
+        return conn
+
     def get_connection(self):
         """Get database connection, create if not exists"""
         conn = getattr(self._local, "connection", None)
         if conn is None:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._open_connection()
             self._local.connection = conn
-            self._connections.append(conn)
         return conn
-    
+
+    def iter_rows(self, query: str, params=(), batch_size: int = 100):
+        """Yield the rows of a query, fetched batch_size at a time from a private connection.
+
+        Streaming responses resume the generator on different worker threads, hence check_same_thread=False;
+        the connection is never shared outside this generator.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
     def initialize_database(self):
         """Initialize the database with required tables"""
         conn = self.get_connection()
@@ -335,12 +407,14 @@ class DatabaseManager:
         self._ensure_column(cursor, 'station_snapshots', 'quality_score', 'REAL')
         self._ensure_column(cursor, 'interpretation_cache', 'provider', 'TEXT')
         self._ensure_column(cursor, 'processing_jobs', 'updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
+        self._ensure_column(cursor, 'processing_jobs', 'content_sha1', 'TEXT')
         self._ensure_column(cursor, 'app_state', 'updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
         self._ensure_column(cursor, 'auth_users', 'is_admin', 'INTEGER DEFAULT 0')
         
         # Création des index pour la performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_bulletins_date ON bulletins(date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_bulletins_type ON bulletins(type)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bulletins_type_date ON bulletins(type, date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_weather_bulletin ON weather_data(bulletin_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_weather_station ON weather_data(station_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_pdf ON station_snapshots(pdf_path)")
@@ -349,6 +423,13 @@ class DatabaseManager:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_station_history_bulletin ON station_data_history(bulletin_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_station_history_station ON station_data_history(station_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_station_history_updated ON station_data_history(updated_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_content_sha1 ON processing_jobs(content_sha1)")
+        # Detail (date + plus recent) et liste (plus recents) des metriques lus dans l'ordre de l'index, sans tri.
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_eval_metrics_date_calc ON evaluation_metrics(bulletin_date, calculated_at DESC)"
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_metrics_calc ON evaluation_metrics(calculated_at DESC)")
+        cursor.execute("ANALYZE evaluation_metrics")
         
         conn.commit()
     
@@ -584,7 +665,11 @@ class DatabaseManager:
             
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+        updated = self._update_bulletin_interpretations(cursor, date, bulletin_type, interpretations)
+        conn.commit()
+        return updated
+
+    def _update_bulletin_interpretations(self, cursor, date, bulletin_type, interpretations) -> int:
         fields = []
         params = []
         
@@ -605,7 +690,6 @@ class DatabaseManager:
         
         query = f"UPDATE bulletins SET {', '.join(fields)} WHERE date = ? AND type = ?"
         cursor.execute(query, params)
-        conn.commit()
         return cursor.rowcount
 
     def update_station_interpretations(self, pdf_path, station_name, bulletin_type, interpretations):
@@ -686,6 +770,43 @@ class DatabaseManager:
         cursor.execute(query, params)
         
         return cursor.fetchall()
+
+    def get_observation_forecast_pairs_bulk(self, date_pairs, station_id: Optional[int] = None):
+        """Get observation/forecast pairs for many (observation_date, forecast_date) pairs in one query.
+
+        Rows are the same as get_observation_forecast_pairs, prefixed with the observation date.
+        """
+        if not date_pairs:
+            return []
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        # Les couples de dates passent en un seul parametre JSON (pas de limite de variables SQLite).
+        query = '''
+            WITH pairs(obs_date, fore_date) AS (
+                SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]') FROM json_each(?)
+            )
+            SELECT
+                p.obs_date,
+                s.name,
+                obs.tmin as tmin_obs,
+                obs.tmax as tmax_obs,
+                obs.weather_condition as weather_obs,
+                fore.tmin as tmin_fore,
+                fore.tmax as tmax_fore,
+                fore.weather_condition as weather_fore
+            FROM pairs p
+            JOIN bulletins b_obs ON b_obs.date = p.obs_date AND b_obs.type = 'observation'
+            JOIN weather_data obs ON obs.bulletin_id = b_obs.id
+            JOIN stations s ON s.id = obs.station_id
+            JOIN bulletins b_fore ON b_fore.date = p.fore_date AND b_fore.type = 'forecast'
+            JOIN weather_data fore ON fore.bulletin_id = b_fore.id AND fore.station_id = obs.station_id
+        '''
+        params = [json.dumps([list(pair) for pair in date_pairs])]
+        if station_id is not None:
+            query += " WHERE s.id = ?"
+            params.append(station_id)
+        cursor.execute(query, params)
+        return cursor.fetchall()
     
     def save_evaluation_metrics(self, observation_date, forecast_date, metrics):
         """Save evaluation metrics to database."""
@@ -728,18 +849,98 @@ class DatabaseManager:
                 pass
         self._connections.clear()
 
-    def create_job(self, job_id: str, job_type: str, payload: Dict) -> None:
+    def create_job(
+        self,
+        job_id: str,
+        job_type: str,
+        payload: Dict,
+        content_sha1: Optional[str] = None,
+    ) -> None:
         conn = self.get_connection()
         cursor = conn.cursor()
         cursor.execute(
             '''
-            INSERT INTO processing_jobs (id, job_type, status, payload_json)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO processing_jobs (id, job_type, status, payload_json, content_sha1)
+            VALUES (?, ?, ?, ?, ?)
             ''',
-            (job_id, job_type, "pending", json.dumps(payload, ensure_ascii=False)),
+            (job_id, job_type, "pending", json.dumps(payload, ensure_ascii=False), content_sha1),
         )
         conn.commit()
 
+    def create_jobs(self, rows: List[tuple]) -> int:
+        """Insert several (job_id, job_type, payload[, content_sha1]) jobs in a single transaction."""
+        params = [
+            (row[0], row[1], "pending", json.dumps(row[2], ensure_ascii=False), row[3] if len(row) > 3 else None)
+            for row in rows
+        ]
+        if not params:
+            return 0
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            '''
+            INSERT INTO processing_jobs (id, job_type, status, payload_json, content_sha1)
+            VALUES (?, ?, ?, ?, ?)
+            ''',
+            params,
+        )
+        conn.commit()
+        return len(params)
+
+    def complete_jobs(self, rows: List[tuple]) -> int:
+        """Mark several (job_id, result) jobs as successful in a single transaction."""
+        params = [(json.dumps(result, ensure_ascii=False), job_id) for job_id, result in rows]
+        if not params:
+            return 0
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            '''
+            UPDATE processing_jobs
+            SET status = 'success', result_json = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            ''',
+            params,
+        )
+        conn.commit()
+        return len(params)
+
+    def get_job_results_by_sha1(
+        self,
+        hashes: List[str],
+        job_type: str = "upload_bulletin",
+        fingerprint: Optional[str] = None,
+    ) -> Dict[str, Dict]:
+        """Return the latest successful result per content hash for already processed files.
+
+        With a fingerprint, only jobs whose payload recorded the same extractor fingerprint are considered.
+        """
+        unique = list(dict.fromkeys(value for value in hashes if value))
+        if not unique:
+            return {}
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        results: Dict[str, Dict] = {}
+        fingerprint_clause = "AND json_extract(payload_json, '$.extractor_fingerprint') = ?" if fingerprint else ""
+        fingerprint_params = (fingerprint,) if fingerprint else ()
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f'''
+                SELECT content_sha1, result_json
+                FROM processing_jobs
+                WHERE content_sha1 IN ({placeholders})
+                  AND job_type = ? AND status = 'success' AND result_json IS NOT NULL
+                  {fingerprint_clause}
+                ORDER BY updated_at ASC
+                ''',
+                (*chunk, job_type, *fingerprint_params),
+            )
+            for content_sha1, result_json in cursor.fetchall():
+                results[content_sha1] = json.loads(result_json)
+        return results
+
     def update_job(
         self,
         job_id: str,
@@ -768,6 +969,50 @@ class DatabaseManager:
         )
         conn.commit()
 
+    def bulk_update_jobs(
+        self,
+        job_ids: List[str],
+        status: str,
+        error_message: Optional[str] = None,
+        where_status: Optional[str] = None,
+    ) -> int:
+        """Set the status of several jobs with one UPDATE per 500 ids; returns the updated row count."""
+        if not job_ids:
+            return 0
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        updated = 0
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            query = (
+                "UPDATE processing_jobs SET status = ?, error_message = COALESCE(?, error_message), "
+                f"updated_at = CURRENT_TIMESTAMP WHERE id IN ({placeholders})"
+            )
+            params: List = [status, error_message, *chunk]
+            if where_status is not None:
+                query += " AND status = ?"
+                params.append(where_status)
+            cursor.execute(query, params)
+            updated += cursor.rowcount
+        conn.commit()
+        return updated
+
+    def claim_job(self, job_id: str) -> bool:
+        """Move a job from 'pending' to 'running'; False if it was canceled or already claimed."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            '''
+            UPDATE processing_jobs
+            SET status = 'running', updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'pending'
+            ''',
+            (job_id,),
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+
     def get_job(self, job_id: str) -> Optional[Dict]:
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -796,18 +1041,20 @@ class DatabaseManager:
         }
 
     def get_jobs(self, job_ids: List[str]) -> List[Dict]:
+        """Return the jobs matching job_ids, in the same order (unknown ids are skipped)."""
         if not job_ids:
             return []
         conn = self.get_connection()
         cursor = conn.cursor()
-        placeholders = ",".join("?" for _ in job_ids)
+        # json_each garde l'ordre des ids fournis (et n'est pas borne par la limite de parametres SQLite).
         cursor.execute(
-            f'''
-            SELECT id, job_type, status, payload_json, result_json, error_message, created_at, updated_at
-            FROM processing_jobs
-            WHERE id IN ({placeholders})
+            '''
+            SELECT j.id, j.job_type, j.status, j.payload_json, j.result_json, j.error_message, j.created_at, j.updated_at
+            FROM json_each(?) AS ordered
+            JOIN processing_jobs AS j ON j.id = ordered.value
+            ORDER BY ordered.key
             ''',
-            job_ids,
+            (json.dumps(list(job_ids)),),
         )
         rows = cursor.fetchall()
         jobs = []
@@ -827,6 +1074,7 @@ class DatabaseManager:
                 }
             )
         return jobs
+
     def get_app_state(self, key: str) -> Optional[str]:
         """Return a stored app state value."""
         if not key:
@@ -966,7 +1214,7 @@ class DatabaseManager:
         if not row or not row[0]:
             return None
         try:
-            payload = json.loads(row[0])
+            payload = _json_loads(row[0])
         except Exception:
             return None
         return payload if isinstance(payload, dict) else None
@@ -1025,13 +1273,69 @@ class DatabaseManager:
         )
         return cursor.fetchone() is not None
 
+    def bulk_has_bulletins(self, file_paths: List[str]) -> set:
+        """Return the subset of file_paths that already have a bulletin (same matching as has_bulletin_for_pdf)."""
+        normalized = {self._normalize_path(str(path)): path for path in file_paths if path}
+        if not normalized:
+            return set()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        keys = list(normalized)
+        found = set()
+        # Rester sous la limite de variables SQLite.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"SELECT DISTINCT lower(file_path) FROM bulletins WHERE lower(file_path) IN ({placeholders})",
+                chunk,
+            )
+            found.update(normalized[row[0]] for row in cursor.fetchall() if row[0] in normalized)
+        return found
+
+    def bulk_insert_bulletins(self, rows: List[tuple]) -> int:
+        """Insert (date, type, file_path, title) rows in a single transaction."""
+        if not rows:
+            return 0
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO bulletins (date, type, file_path, title) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+        return len(rows)
+
+    def bulk_upsert_bulletin_payloads(self, rows: List[tuple]) -> int:
+        """Store several (pdf_path, payload) pairs in a single transaction."""
+        params = [(pdf_path, _json_dumps(payload)) for pdf_path, payload in rows if pdf_path]
+        if not params:
+            return 0
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            '''
+            INSERT INTO bulletin_payloads (pdf_path, payload_json)
+            VALUES (?, ?)
+            ON CONFLICT(pdf_path)
+            DO UPDATE SET payload_json = excluded.payload_json, updated_at = CURRENT_TIMESTAMP
+            ''',
+            params,
+        )
+        conn.commit()
+        return len(params)
+
     def upsert_bulletin_payload(self, pdf_path: str, payload: Dict) -> None:
         """Store the full JSON payload for a bulletin."""
         if not pdf_path:
             return
         conn = self.get_connection()
         cursor = conn.cursor()
-        payload_json = json.dumps(payload, ensure_ascii=False)
+        self._upsert_bulletin_payload(cursor, pdf_path, payload)
+        conn.commit()
+
+    def _upsert_bulletin_payload(self, cursor, pdf_path: str, payload: Dict) -> None:
+        payload_json = _json_dumps(payload)
         cursor.execute(
             '''
             INSERT INTO bulletin_payloads (pdf_path, payload_json)
@@ -1041,18 +1345,18 @@ class DatabaseManager:
             ''',
             (pdf_path, payload_json),
         )
-        conn.commit()
 
     def upsert_station_snapshot(self, pdf_path: str, station: Dict) -> None:
         """Store a flattened snapshot for a station."""
-        if not pdf_path:
-            return
-        station_name = station.get("name")
-        if not station_name:
+        if not pdf_path or not station.get("name"):
             return
         conn = self.get_connection()
         cursor = conn.cursor()
+        self._upsert_station_snapshot(cursor, pdf_path, station)
+        conn.commit()
 
+    def _upsert_station_snapshot(self, cursor, pdf_path: str, station: Dict) -> None:
+        station_name = station.get("name")
         observation = station.get("observation") or {}
         prevision = station.get("prevision") or {}
         validation_errors = station.get("validation_errors") or []
@@ -1121,14 +1425,39 @@ class DatabaseManager:
                 station.get("interpretation_francais"),
                 station.get("interpretation_moore"),
                 station.get("interpretation_dioula"),
-                json.dumps(last_bbox, ensure_ascii=False) if last_bbox is not None else None,
+                _json_dumps(last_bbox) if last_bbox is not None else None,
                 station.get("validation_status"),
-                json.dumps(validation_errors, ensure_ascii=False) if validation_errors else None,
-                json.dumps(observation, ensure_ascii=False) if observation else None,
-                json.dumps(prevision, ensure_ascii=False) if prevision else None,
+                _json_dumps(validation_errors) if validation_errors else None,
+                _json_dumps(observation) if observation else None,
+                _json_dumps(prevision) if prevision else None,
             ),
         )
-        conn.commit()
+
+    def apply_translation_result(
+        self,
+        date: str,
+        bulletin_type: str,
+        translations: Dict,
+        pdf_path: Optional[str],
+        station_snapshot: Optional[Dict] = None,
+        payload_entry: Optional[Dict] = None,
+    ) -> int:
+        """Persist interpretations, station snapshot and bulletin payload in one transaction."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            updated = 0
+            if translations:
+                updated = self._update_bulletin_interpretations(cursor, date, bulletin_type, translations)
+            if pdf_path and station_snapshot and station_snapshot.get("name"):
+                self._upsert_station_snapshot(cursor, pdf_path, station_snapshot)
+            if pdf_path and payload_entry is not None:
+                self._upsert_bulletin_payload(cursor, pdf_path, payload_entry)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return updated
 
     def get_average_quality_score(self, date: Optional[str] = None) -> Optional[float]:
         conn = self.get_connection()
@@ -1422,7 +1751,7 @@ class DatabaseManager:
             if not payload_json:
                 continue
             try:
-                payload = json.loads(payload_json)
+                payload = _json_loads(payload_json)
             except Exception:
                 continue
             if not isinstance(payload, dict):
@@ -1446,7 +1775,7 @@ class DatabaseManager:
                 station['quality_score'] = 1.0
                 changed = True
             if changed:
-                payload_json = json.dumps(payload, ensure_ascii=False)
+                payload_json = _json_dumps(payload)
                 cursor.execute(
                     '''
                     UPDATE bulletin_payloads
@@ -1966,7 +2295,7 @@ class DatabaseManager:
             if not raw_json:
                 return raw_json
             try:
-                payload = json.loads(raw_json)
+                payload = _json_loads(raw_json)
             except Exception:
                 return raw_json
             if not isinstance(payload, dict):
@@ -1976,7 +2305,7 @@ class DatabaseManager:
             payload["tmin_raw"] = tmin_raw
             payload["tmax_raw"] = tmax_raw
             payload["weather_condition"] = weather_condition
-            return json.dumps(payload, ensure_ascii=False)
+            return _json_dumps(payload)
 
         if map_type == "observation":
             observation_json = _update_measurement(observation_json)
@@ -2035,7 +2364,7 @@ class DatabaseManager:
         if not row or not row[0]:
             return 0
         try:
-            payload = json.loads(row[0])
+            payload = _json_loads(row[0])
         except Exception:
             return 0
         if not isinstance(payload, dict):
@@ -2068,7 +2397,7 @@ class DatabaseManager:
             station["quality_score"] = 1.0
             changed = True
         if changed:
-            payload_json = json.dumps(payload, ensure_ascii=False)
+            payload_json = _json_dumps(payload)
             cursor.execute(
                 '''
                 UPDATE bulletin_payloads
@@ -2342,7 +2671,7 @@ class DatabaseManager:
             if not payload_json:
                 continue
             try:
-                payload = json.loads(payload_json)
+                payload = _json_loads(payload_json)
             except Exception:
                 continue
             if isinstance(payload, dict):
@@ -2387,19 +2716,34 @@ class DatabaseManager:
         row = cursor.fetchone()
         return row[0] if row else None
 
-    def list_bulletin_dates(self, bulletin_type: str) -> List[str]:
-        """Return distinct bulletin dates for a given type."""
+    def list_bulletin_dates(
+        self,
+        bulletin_type: str,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+    ) -> List[str]:
+        """Return distinct bulletin dates for a given type, optionally filtered by year and/or month."""
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute(
-            """
+        query = """
             SELECT DISTINCT date
             FROM bulletins
             WHERE type = ?
-            ORDER BY date ASC
-            """,
-            (bulletin_type,),
-        )
+        """
+        params: List[Any] = [bulletin_type]
+        # Bornes de dates indexables (idx_bulletins_type_date) plutot qu'un filtre Python sur toute la liste.
+        if year is not None and month is not None:
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            query += " AND date >= ? AND date < ?"
+            params += [f"{year:04d}-{month:02d}-01", f"{next_year:04d}-{next_month:02d}-01"]
+        elif year is not None:
+            query += " AND date >= ? AND date < ?"
+            params += [f"{year:04d}-01-01", f"{year + 1:04d}-01-01"]
+        elif month is not None:
+            query += " AND substr(date, 6, 2) = ?"
+            params.append(f"{month:02d}")
+        query += " ORDER BY date ASC"
+        cursor.execute(query, params)
         return [row[0] for row in cursor.fetchall()]
 
     def has_evaluation(self, bulletin_date: str, forecast_reference_date: str) -> bool:
@@ -2455,9 +2799,15 @@ class DatabaseManager:
 
     def save_monthly_metrics(self, year: int, month: int, metrics: Dict) -> None:
         """Sauvegarde les métriques mensuelles agrégées."""
+        self.bulk_save_monthly_metrics([(year, month, metrics)])
+
+    def bulk_save_monthly_metrics(self, rows: List[tuple]) -> int:
+        """Upsert several (year, month, metrics) rows in a single transaction."""
+        if not rows:
+            return 0
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute(
+        cursor.executemany(
             """
             INSERT INTO monthly_metrics 
             (year, month, mae_tmin, mae_tmax, rmse_tmin, rmse_tmax,
@@ -2479,24 +2829,13 @@ class DatabaseManager:
                 days_evaluated = excluded.days_evaluated,
                 calculated_at = CURRENT_TIMESTAMP
             """,
-            (
-                year,
-                month,
-                metrics.get("mae_tmin"),
-                metrics.get("mae_tmax"),
-                metrics.get("rmse_tmin"),
-                metrics.get("rmse_tmax"),
-                metrics.get("bias_tmin"),
-                metrics.get("bias_tmax"),
-                metrics.get("accuracy_weather"),
-                metrics.get("precision_weather"),
-                metrics.get("recall_weather"),
-                metrics.get("f1_score_weather"),
-                metrics.get("sample_size"),
-                metrics.get("days_evaluated"),
-            ),
+            [
+                (year, month, *(metrics.get(field) for field in _MONTHLY_METRIC_FIELDS))
+                for year, month, metrics in rows
+            ],
         )
         conn.commit()
+        return len(rows)
 
     def list_monthly_metrics(self, limit: int = 12) -> List[Dict]:
         """Liste les métriques mensuelles récentes."""
@@ -2586,9 +2925,15 @@ class DatabaseManager:
     
     def save_station_monthly_metrics(self, station_id: int, year: int, month: int, metrics: Dict) -> None:
         """Sauvegarde les métriques mensuelles pour une station."""
+        self.bulk_save_station_monthly_metrics([(station_id, year, month, metrics)])
+
+    def bulk_save_station_monthly_metrics(self, rows: List[tuple]) -> int:
+        """Upsert several (station_id, year, month, metrics) rows in a single transaction."""
+        if not rows:
+            return 0
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute(
+        cursor.executemany(
             """
             INSERT INTO station_monthly_metrics 
             (station_id, year, month, mae_tmin, mae_tmax, rmse_tmin, rmse_tmax,
@@ -2610,25 +2955,13 @@ class DatabaseManager:
                 days_evaluated = excluded.days_evaluated,
                 calculated_at = CURRENT_TIMESTAMP
             """,
-            (
-                station_id,
-                year,
-                month,
-                metrics.get("mae_tmin"),
-                metrics.get("mae_tmax"),
-                metrics.get("rmse_tmin"),
-                metrics.get("rmse_tmax"),
-                metrics.get("bias_tmin"),
-                metrics.get("bias_tmax"),
-                metrics.get("accuracy_weather"),
-                metrics.get("precision_weather"),
-                metrics.get("recall_weather"),
-                metrics.get("f1_score_weather"),
-                metrics.get("sample_size"),
-                metrics.get("days_evaluated"),
-            ),
+            [
+                (station_id, year, month, *(metrics.get(field) for field in _MONTHLY_METRIC_FIELDS))
+                for station_id, year, month, metrics in rows
+            ],
         )
         conn.commit()
+        return len(rows)
     
     def get_station_monthly_metrics(self, station_id: int, year: int, month: int) -> Optional[Dict]:
         """Récupère les métriques mensuelles pour une station."""
@@ -2714,11 +3047,10 @@ class DatabaseManager:
         cursor = conn.cursor()
         cursor.execute(
             """
-            SELECT DISTINCT s.id, s.name,
-                   (SELECT COUNT(*) FROM station_monthly_metrics sm WHERE sm.station_id = s.id) as metrics_count,
-                   (SELECT MAX(sm.calculated_at) FROM station_monthly_metrics sm WHERE sm.station_id = s.id) as last_calculated
-            FROM stations s
-            WHERE EXISTS (SELECT 1 FROM station_monthly_metrics sm WHERE sm.station_id = s.id)
+            SELECT s.id, s.name, COUNT(*) as metrics_count, MAX(sm.calculated_at) as last_calculated
+            FROM station_monthly_metrics sm
+            JOIN stations s ON s.id = sm.station_id
+            GROUP BY sm.station_id
             ORDER BY s.name
             """
         )
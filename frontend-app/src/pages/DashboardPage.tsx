@@ -245,7 +245,7 @@ export function DashboardPage() {
  const loadMetricsHistory = async () => {
   if (!selectedDate) return;
   try {
-  const list = await fetchMetricsList(60);
+  const list = await fetchMetricsList(60, true);
   setMetricsHistory(Array.isArray(list.items) ? list.items : []);
   setTrendError(null);
   } catch (err) {
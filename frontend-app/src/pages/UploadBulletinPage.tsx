@@ -580,16 +580,17 @@ export function UploadBulletinPage() {
                <div
                  className="h-2 rounded-full bg-emerald-500"
                  style={{
-                   width: `${Math.round((batchStatus.success / Math.max(1, batchStatus.total)) * 100)}%`,
+                   width: `${Math.round(((batchStatus.success + (batchStatus.skipped ?? 0)) / Math.max(1, batchStatus.total)) * 100)}%`,
                  }}
                />
              </div>
-             <div className="grid gap-2 sm:grid-cols-5 text-xs text-muted">
+             <div className="grid gap-2 sm:grid-cols-6 text-xs text-muted">
                <div>En attente: {batchStatus.pending}</div>
                <div>En cours: {batchStatus.running}</div>
                <div>OK: {batchStatus.success}</div>
                <div>Erreur: {batchStatus.error}</div>
                <div>Annule: {batchStatus.canceled}</div>
+               <div>Doublons: {batchStatus.skipped ?? 0}</div>
              </div>
              {batchStatus.status === "running" && (
                <div>
@@ -456,6 +456,7 @@ export interface UploadJobResponse {
   status: string;
   filename?: string;
   pdf_path?: string;
+  duplicate_of?: string | null;
 }
 
 export interface UploadBatchResponse {
@@ -488,6 +489,7 @@ export interface UploadBatchStatus {
   success: number;
   error: number;
   canceled: number;
+  skipped?: number;
   jobs: UploadJobStatus[];
 }
 
@@ -603,8 +605,9 @@ export async function fetchMetricsByDate(date: string) {
   return requestJson<MetricsResponse>(`/metrics/${encodeURIComponent(date)}`);
 }
 
-export async function fetchMetricsList(limit = 50) {
-  return requestJson<MetricsListResponse>(`/metrics?limit=${limit}`);
+export async function fetchMetricsList(limit = 50, includeConfusion = false) {
+  const confusionParam = includeConfusion ? "&include_confusion=true" : "";
+  return requestJson<MetricsListResponse>(`/metrics?limit=${limit}${confusionParam}`);
 }
 
 export interface StationDataRow {
@@ -1212,6 +1215,8 @@ export async function listTranslationTasks(status?: string) {
       metadata: Record<string, any>;
     }>;
     total: number;
+    limit: number;
+    offset: number;
     running_count: number;
   }>(`/bulletins/translation-tasks${query}`);
 }